@@ -4,9 +4,20 @@
  */
 
 import axios from 'axios';
+import http from 'http';
+import https from 'https';
 
 const PYTHON_SCANNER_URL = process.env.PYTHON_SCANNER_URL || 'http://localhost:8001';
 
+// Reuse TCP (and TLS) connections to the scanner across calls instead of
+// opening a new socket for every precheck/audit/health request.
+// The scanner runs uvicorn with --timeout-keep-alive 300, so idle sockets stay valid.
+const keepAliveOptions = { keepAlive: true, maxSockets: 32, maxFreeSockets: 8 };
+const scannerClient = axios.create({
+    httpAgent: new http.Agent(keepAliveOptions),
+    httpsAgent: new https.Agent(keepAliveOptions)
+});
+
 /**
  * Perform audit using Python/Camoufox scanner service (primary method)
  * @param {object} options - Audit options
@@ -26,11 +37,13 @@ export async function tryPythonScanner(options) {
     try {
         console.log(`🐍 Using Python/Camoufox scanner for: ${url} (${isLiteVersion ? 'lite' : 'full'} audit, ${timeoutMinutes}min timeout)`);
         
-        const response = await axios.post(`${PYTHON_SCANNER_URL}/audit`, {
+        const response = await scannerClient.post(`${PYTHON_SCANNER_URL}/audit`, {
             url: url,
             device: device,
             format: format,
-            isLiteVersion: isLiteVersion
+            isLiteVersion: isLiteVersion,
+            // The report is saved locally below, so the scanner need not write its own copy
+            persistReport: false
         }, {
             timeout: timeoutMs,
             headers: {
@@ -188,7 +201,7 @@ export async function pythonPrecheck(url) {
     try {
         console.log(`🐍 Python precheck for: ${url} (60s timeout)`);
         
-        const response = await axios.post(`${PYTHON_SCANNER_URL}/precheck`, {
+        const response = await scannerClient.post(`${PYTHON_SCANNER_URL}/precheck`, {
             url: url
         }, {
             timeout: precheckTimeout,
@@ -278,7 +291,7 @@ export async function pythonPrecheck(url) {
  */
 export async function isPythonScannerAvailable() {
     try {
-        const response = await axios.get(`${PYTHON_SCANNER_URL}/health`, {
+        const response = await scannerClient.get(`${PYTHON_SCANNER_URL}/health`, {
             timeout: 5000
         });
         return response.data?.status === 'healthy';
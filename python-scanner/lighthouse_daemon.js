@@ -0,0 +1,69 @@
+/**
+ * Long-lived Lighthouse worker for the Python scanner
+ *
+ * Spawning `node lighthouse_runner.js` per audit pays for Node start-up and the
+ * Lighthouse module import every time. This daemon loads Lighthouse once and then
+ * serves audits over stdin/stdout, one JSON object per line:
+ *
+ *   request:  {"id": 1, "url": "...", "device": "desktop", "isLite": false, "cdpUrl": null, "outputPath": null}
+ *   reply:    {"id": 1, "ok": true, "report": {...}} | {"id": 1, "ok": false, "error": "..."}
+ *
+ * The report travels inline in the reply, so no temp file is written or read back.
+ * outputPath is optional and only keeps an extra copy on disk for debugging.
+ *
+ * Lighthouse does not support concurrent runs in one process, so requests are
+ * handled one at a time; the Python side runs several daemons for parallelism.
+ */
+
+// stdout is reserved for replies - route all console output to stderr
+console.log = console.info = console.debug = console.error;
+
+const readline = require('readline');
+const { loadLighthouse, runLighthouse } = require('./lighthouse_runner');
+
+function reply(message) {
+    process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+async function handle(line) {
+    let request;
+    try {
+        request = JSON.parse(line);
+    } catch (error) {
+        console.error(`Ignoring malformed request: ${error.message}`);
+        return;
+    }
+
+    try {
+        const report = await runLighthouse(request);
+        reply({ id: request.id, ok: true, report });
+    } catch (error) {
+        console.error('Lighthouse error:', error.message);
+        console.error(error.stack);
+        reply({ id: request.id, ok: false, error: error.message });
+    }
+}
+
+async function main() {
+    // Pay for the module import once, up front
+    loadLighthouse();
+    console.log('✅ Lighthouse daemon ready');
+
+    // Serialize audits: queue each line behind the previous one
+    let queue = Promise.resolve();
+    const lines = readline.createInterface({ input: process.stdin });
+    lines.on('line', (line) => {
+        if (line.trim()) {
+            queue = queue.then(() => handle(line));
+        }
+    });
+    // Parent went away: finish the current audit, then exit
+    lines.on('close', () => {
+        queue.then(() => process.exit(0));
+    });
+}
+
+main().catch((error) => {
+    console.error('Lighthouse daemon failed to start:', error.message);
+    process.exit(1);
+});
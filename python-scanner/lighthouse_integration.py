@@ -1,106 +1,187 @@
 """
 Lighthouse Integration with Camoufox
-This module allows running Lighthouse audits using Node.js subprocess.
+This module allows running Lighthouse audits using long-lived Node.js worker processes.
 Lighthouse will use its own Chrome instance with anti-detection flags similar to Camoufox.
 """
 
 import asyncio
 import json
-import subprocess
+import logging
 import tempfile
 import os
-import sys
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+# orjson parses multi-MB Lighthouse reports several times faster than json (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+logger = logging.getLogger("scanner.lighthouse")
+
+
+# Resolved once at import. A missing daemon script makes the import fail, so the
+# scanner sees LIGHTHOUSE_AVAILABLE = False and uses its custom audits instead.
+_SCRIPT_DIR = Path(__file__).parent
+_DAEMON_SCRIPT = _SCRIPT_DIR / "lighthouse_daemon.js"
+if not _DAEMON_SCRIPT.exists():
+    raise ImportError(f"Lighthouse daemon script not found: {_DAEMON_SCRIPT}")
+# Set NODE_PATH to include local node_modules
+_NODE_ENV = {**os.environ, "NODE_PATH": str(_SCRIPT_DIR / "node_modules")}
+
+# Number of long-lived `node lighthouse_daemon.js` workers (one audit at a time each)
+LIGHTHOUSE_WORKERS = int(os.getenv("LIGHTHOUSE_WORKERS", "4"))
+LIGHTHOUSE_TIMEOUT = 300  # 5 minutes per audit
+# Reports come back inline on one stdout line; allow for very large ones
+_REPLY_LIMIT = 256 * 1024 * 1024
+
+
+class _LighthouseWorker:
+    """
+    One persistent Node process running lighthouse_daemon.js.
+
+    Node start-up and the Lighthouse import are paid once instead of per audit.
+    The process is spawned lazily and respawned if it dies or hangs.
+    """
+
+    def __init__(self):
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._next_id = 0
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self._process is None or self._process.returncode is not None:
+            # stderr is inherited so Lighthouse logs stream straight to the service log
+            self._process = await asyncio.create_subprocess_exec(
+                "node",
+                str(_DAEMON_SCRIPT),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                limit=_REPLY_LIMIT,
+                env=_NODE_ENV,
+                cwd=str(_SCRIPT_DIR)  # Run from script directory so node_modules is found
+            )
+            logger.info(f"🚦 Lighthouse daemon started (pid {self._process.pid})")
+        return self._process
+
+    async def run(self, request: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        process = await self._ensure_started()
+        self._next_id += 1
+        request_id = self._next_id
+        process.stdin.write((json.dumps({"id": request_id, **request}) + "\n").encode("utf-8"))
+        await process.stdin.drain()
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            try:
+                line = await asyncio.wait_for(process.stdout.readline(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                # A hung audit would block every later request on this worker
+                self.kill()
+                raise
+            if not line:
+                self._process = None
+                raise RuntimeError(f"Lighthouse daemon exited unexpectedly (code {process.returncode})")
+            try:
+                reply = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            except ValueError:
+                # Stray output from a dependency, not a reply
+                logger.info(line.decode("utf-8", errors="replace").rstrip())
+                continue
+            # Replies to requests abandoned by a cancelled caller are skipped
+            if isinstance(reply, dict) and reply.get("id") == request_id:
+                return reply
+
+    def kill(self) -> None:
+        if self._process is not None and self._process.returncode is None:
+            self._process.kill()
+        self._process = None
+
+
+_workers: Optional[asyncio.Queue] = None
+
+
+def _get_workers() -> asyncio.Queue:
+    global _workers
+    if _workers is None:
+        _workers = asyncio.Queue()
+        for _ in range(max(1, LIGHTHOUSE_WORKERS)):
+            _workers.put_nowait(_LighthouseWorker())
+    return _workers
+
+
+async def start_lighthouse_workers() -> None:
+    """Spawn the Lighthouse daemons up front so the first audits don't pay for it."""
+    workers = _get_workers()
+    for _ in range(workers.qsize()):
+        worker = workers.get_nowait()
+        try:
+            await worker._ensure_started()
+        finally:
+            workers.put_nowait(worker)
+
+
+async def close_lighthouse_workers() -> None:
+    """Stop the Lighthouse daemons (called on service shutdown)."""
+    if _workers is None:
+        return
+    while not _workers.empty():
+        _workers.get_nowait().kill()
+
 
 async def run_lighthouse_audit(
     url: str,
     device: str = "desktop",
     is_lite: bool = False,
-    output_dir: str = "/tmp",
+    output_dir: Optional[str] = None,
     cdp_endpoint: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Run Lighthouse audit using Node.js subprocess.
+    Run Lighthouse audit on one of the long-lived Node Lighthouse daemons.
+    The report comes back inline in the daemon's reply - no temp file round-trip.
     
     Args:
         url: URL to audit
         device: Device type ('desktop', 'mobile', 'tablet')
         is_lite: Whether to use lite config
-        output_dir: Directory to save the report
+        output_dir: Optional directory to also keep the raw report in (debugging)
     
     Returns:
         Lighthouse report as dictionary
     """
-    # Create temp file for report
-    report_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, dir=output_dir)
-    report_path = report_file.name
-    report_file.close()
+    report_path = None
+    if output_dir:
+        report_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, dir=output_dir)
+        report_path = report_file.name
+        report_file.close()
     
+    workers = _get_workers()
+    worker = await workers.get()
     try:
-        # Get path to lighthouse_runner.js
-        script_dir = Path(__file__).parent
-        runner_script = script_dir / "lighthouse_runner.js"
-        
-        if not runner_script.exists():
-            raise FileNotFoundError(f"Lighthouse runner script not found: {runner_script}")
-        
-        # Use npx to run with local node_modules, or node directly
-        # First try with npx (uses local node_modules), fallback to node
-        cmd = [
-            "node",
-            str(runner_script),
-            url,
-            report_path,
-            device,
-            str(is_lite).lower(),
-            cdp_endpoint or ""  # CDP endpoint from Camoufox (if provided)
-        ]
-        
-        # Set NODE_PATH to include local node_modules
-        env = os.environ.copy()
-        env["NODE_PATH"] = str(script_dir / "node_modules")
-        
-        print(f"🔍 Running Lighthouse audit: {' '.join(cmd)}")
+        logger.info(f"🔍 Running Lighthouse audit: {url} ({device}, lite={is_lite})")
         
-        # Run subprocess with timeout and NODE_PATH set
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-            cwd=str(script_dir)  # Run from script directory so node_modules is found
+        reply = await worker.run(
+            {
+                "url": url,
+                "outputPath": report_path,
+                "device": device,
+                "isLite": is_lite,
+                "cdpUrl": cdp_endpoint or None,  # CDP endpoint from Camoufox (if provided)
+            },
+            timeout=LIGHTHOUSE_TIMEOUT
         )
         
-        stdout, stderr = await asyncio.wait_for(
-            process.communicate(),
-            timeout=300  # 5 minutes timeout
-        )
-        
-        # Print stdout and stderr for debugging (especially config loading messages)
-        if stdout:
-            stdout_text = stdout.decode('utf-8', errors='replace')
-            if stdout_text.strip():
-                print(stdout_text)
-        
-        if stderr:
-            stderr_text = stderr.decode('utf-8', errors='replace')
-            if stderr_text.strip():
-                print(stderr_text, file=sys.stderr)
-        
-        if process.returncode != 0:
-            error_msg = stderr.decode('utf-8', errors='replace') if stderr else "Unknown error"
-            raise RuntimeError(f"Lighthouse failed with code {process.returncode}: {error_msg}")
-        
-        # Read and parse report
-        if not os.path.exists(report_path):
-            raise FileNotFoundError(f"Lighthouse report not created: {report_path}")
+        if not reply.get("ok"):
+            raise RuntimeError(f"Lighthouse failed: {reply.get('error') or 'Unknown error'}")
         
-        with open(report_path, 'r', encoding='utf-8') as f:
-            report = json.load(f)
+        report = reply.get("report")
+        if not isinstance(report, dict):
+            raise RuntimeError("Lighthouse daemon returned no report")
         
-        print(f"✅ Lighthouse audit completed successfully")
+        logger.info("✅ Lighthouse audit completed successfully")
         return report
         
     except asyncio.TimeoutError:
@@ -108,12 +189,4 @@ async def run_lighthouse_audit(
     except Exception as e:
         raise RuntimeError(f"Lighthouse audit failed: {str(e)}")
     finally:
-        # Cleanup temp file
-        try:
-            if os.path.exists(report_path):
-                os.unlink(report_path)
-        except Exception:
-            pass
-
-
-
+        workers.put_nowait(worker)
@@ -1,6 +1,9 @@
 /**
  * Lighthouse Runner for Camoufox Integration
  * This script runs Lighthouse and connects to an existing browser via CDP
+ *
+ * Usable both as a CLI (node lighthouse_runner.js <url> <outputPath> ...) and as a
+ * module: lighthouse_daemon.js requires it and calls runLighthouse() per request.
  */
 
 // CommonJS imports
@@ -10,7 +13,7 @@ const path = require('path');
 // Lighthouse and chrome-launcher - handle both CommonJS and ES module exports
 let lighthouse, chromeLauncher;
 
-async function runLighthouse() {
+function loadLighthouse() {
     // Import Lighthouse and chrome-launcher
     // Lighthouse v12+ may export as ES module even in CommonJS context
     if (!lighthouse || !chromeLauncher) {
@@ -26,23 +29,17 @@ async function runLighthouse() {
             throw new Error(`Lighthouse is not a function. Type: ${typeof lighthouse}, Module keys: ${Object.keys(lighthouseModule)}`);
         }
     }
+}
+
+/**
+ * Run one Lighthouse audit and return the LHR object.
+ * When outputPath is given the report is also written there ('-' = stdout).
+ */
+async function runLighthouse({ url, outputPath, device = 'desktop', isLite = false, cdpUrl }) {
+    loadLighthouse();
     
-    const args = process.argv.slice(2);
-    
-    // Parse arguments
-    const url = args[0];
-    const outputPath = args[1];
-    const device = args[2] || 'desktop';
-    const isLite = args[3] === 'true';
-    const cdpUrl = args[4]; // Optional: CDP WebSocket URL
-    
-    if (!url || !outputPath) {
-        console.error('Usage: node lighthouse_runner.js <url> <outputPath> <device> <isLite> [cdpUrl]');
-        process.exit(1);
-    }
-    
+    let chrome;
     try {
-        let chrome;
         let port;
         
         // If CDP URL provided, connect to existing browser
@@ -390,13 +387,44 @@ async function runLighthouse() {
         }
         
         // Save report
-        fs.writeFileSync(outputPath, JSON.stringify(result.lhr, null, 2));
-        console.log(`Lighthouse report saved to ${outputPath}`);
+        if (outputPath === '-') {
+            process.stdout.write(JSON.stringify(result.lhr));
+        } else if (outputPath) {
+            fs.writeFileSync(outputPath, JSON.stringify(result.lhr, null, 2));
+            console.log(`Lighthouse report saved to ${outputPath}`);
+        }
         
-        // Cleanup
+        return result.lhr;
+    } finally {
+        // Cleanup - always, a long-lived daemon must not leak Chrome processes
         if (chrome) {
             await chrome.kill();
         }
+    }
+}
+
+async function main() {
+    const args = process.argv.slice(2);
+    
+    // Parse arguments
+    const url = args[0];
+    const outputPath = args[1];
+    const device = args[2] || 'desktop';
+    const isLite = args[3] === 'true';
+    const cdpUrl = args[4]; // Optional: CDP WebSocket URL
+    
+    if (!url || !outputPath) {
+        console.error('Usage: node lighthouse_runner.js <url> <outputPath|-> <device> <isLite> [cdpUrl]');
+        process.exit(1);
+    }
+    
+    // Report goes to stdout - keep log output off it
+    if (outputPath === '-') {
+        console.log = console.info = console.error;
+    }
+    
+    try {
+        await runLighthouse({ url, outputPath, device, isLite, cdpUrl });
         
         // Return success
         process.exit(0);
@@ -407,5 +435,9 @@ async function runLighthouse() {
     }
 }
 
-runLighthouse();
+module.exports = { loadLighthouse, runLighthouse };
+
+if (require.main === module) {
+    main();
+}
 
@@ -5,30 +5,97 @@ and perform accessibility audits compatible with Lighthouse format.
 """
 
 import asyncio
+import atexit
+import importlib.util
+import inspect
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import sys
 import tempfile
 import time
-import threading
+import types
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Dict, Any, List, Tuple
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Set, Tuple
 from urllib.parse import urlparse
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from camoufox.sync_api import Camoufox
-from bs4 import BeautifulSoup
+from camoufox.async_api import AsyncCamoufox
+
+# Progress messages go through the "scanner" logger. Records are queued and written to
+# stdout by a background thread, so concurrent audits never wait on the write itself.
+logger = logging.getLogger("scanner")
+if not logger.handlers:  # running as __main__ imports this module a second time for uvicorn
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_output = logging.StreamHandler(sys.stdout)
+    _log_output.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # flushes what is still queued
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
 # Try to import Lighthouse integration (optional - falls back to custom audits if not available)
 # Enable Lighthouse integration
 try:
-    from lighthouse_integration import run_lighthouse_audit
+    from lighthouse_integration import run_lighthouse_audit, start_lighthouse_workers, close_lighthouse_workers
     LIGHTHOUSE_AVAILABLE = True
 except ImportError:
     LIGHTHOUSE_AVAILABLE = False
-    print("⚠️ Lighthouse integration not available, using custom audits")
+    logger.warning("⚠️ Lighthouse integration not available, using custom audits")
+
+# Optional plain-HTTP fast path for prechecks (HTTP/2 when h2 is installed)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# orjson encodes the large reports (responses and files) several times faster than json (optional)
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+    DefaultResponse = ORJSONResponse
+except ImportError:
+    ORJSON_AVAILABLE = False
+    DefaultResponse = JSONResponse
+
+# Playwright 1.40-1.52 record the caller's stack with inspect.stack() on every API call (for
+# error messages and tracing). inspect.stack() resolves the source file of every frame,
+# a noticeable share of CPU across the many small calls of an audit. Swap in a walk that
+# only reads the frame objects, which is all Playwright uses (PW_INSPECT_STACK=1 keeps it).
+# Written against playwright._impl._connection of 1.52; from 1.53 it uses
+# inspect.currentframe() instead and the patch is skipped.
+def _cheap_stack() -> List[inspect.FrameInfo]:
+    frame = sys._getframe(1)
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(inspect.FrameInfo(frame, code.co_filename, frame.f_lineno, code.co_name, None, None))
+        frame = frame.f_back
+    return stack
+
+
+if os.getenv("PW_INSPECT_STACK", "0") != "1":
+    try:
+        import playwright._impl._connection as _pw_connection
+        # Private module: only patch the call this was written for, if it is still there
+        if "inspect.stack()" in inspect.getsource(_pw_connection):
+            _pw_connection.inspect = types.SimpleNamespace(**{**vars(inspect), "stack": _cheap_stack})
+            logger.info("Using frame-walk call-site capture for Playwright (PW_INSPECT_STACK=1 disables it)")
+    except (ImportError, AttributeError, OSError):
+        pass
 
 # Configure logging to filter out health check requests
 class HealthCheckFilter(logging.Filter):
@@ -38,10 +105,412 @@ class HealthCheckFilter(logging.Filter):
 # Apply filter to uvicorn access logs
 logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter())
 
-app = FastAPI(title="SilverSurfers Python Scanner", version="1.0.0")
+# Maximum number of scans (audits + prechecks) sharing the browser at once
+MAX_CONCURRENT_SCANS = int(os.getenv("MAX_CONCURRENT_SCANS", "8"))
+# Recycle the browser after this many scans to bound Firefox memory growth (0 = never)
+CAMOUFOX_MAX_USES = int(os.getenv("CAMOUFOX_MAX_USES", "50"))
+# Warm per-host contexts kept for reuse are closed after this many idle seconds
+CONTEXT_IDLE_TTL = float(os.getenv("CONTEXT_IDLE_TTL", "600"))
+# Seconds after the Lighthouse attempt starts before the custom Camoufox audit is
+# started alongside it as a hedge (negative = off: only run it after Lighthouse fails).
+# Opt-in: set it above the usual Lighthouse run time, or most successful audits also
+# run a Camoufox audit that is thrown away
+AUDIT_HEDGE_DELAY = float(os.getenv("AUDIT_HEDGE_DELAY", "-1"))
+# Audits of one /audit/batch call running at the same time
+BATCH_AUDIT_CONCURRENCY = int(os.getenv("BATCH_AUDIT_CONCURRENCY", "4"))
+# Audits running or waiting for a browser slot before new ones are turned away
+# with 503 instead of queueing without bound (0 = unlimited)
+MAX_PENDING_AUDITS = int(os.getenv("MAX_PENDING_AUDITS", "32"))
+
+# Successful audits are reused for identical requests within this window
+# (seconds, 0 = no caching), keeping at most AUDIT_CACHE_SIZE responses
+AUDIT_CACHE_TTL = float(os.getenv("AUDIT_CACHE_TTL", "300"))
+AUDIT_CACHE_SIZE = int(os.getenv("AUDIT_CACHE_SIZE", "512"))
+
+
+def _default_report_dir() -> str:
+    # RAM-backed tmpfs keeps multi-MB report writes off the disk when available
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+# Where audit reports are written; TEMP_DIR wins (e.g. a mounted volume for persistence)
+REPORT_DIR = os.getenv("TEMP_DIR") or _default_report_dir()
+os.makedirs(REPORT_DIR, exist_ok=True)
+
+# Serializing and writing a multi-MB report blocks; keep it off the event loop
+REPORT_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="report-io")
+# Reports are read by machines; PRETTY_REPORT=1 indents them for debugging
+PRETTY_REPORT = os.getenv("PRETTY_REPORT", "0") == "1"
+
+
+# Report filenames use the hostname with its dots turned into dashes
+_HOSTNAME_TO_FILENAME = str.maketrans(".", "-")
+
+
+@lru_cache(maxsize=1024)
+def _normalize_url(url: str) -> Tuple[str, str]:
+    """Return (URL with a scheme, its hostname for report filenames), cached since the same sites come back often"""
+    url = url.strip()
+    if not url.startswith(("http://", "https://")):
+        url = f"https://{url}"
+    return url, (urlparse(url).hostname or "unknown").translate(_HOSTNAME_TO_FILENAME)
+
+
+def _new_report_path(hostname: str, is_lite: bool) -> str:
+    """Path for a new report file of `hostname`, unique per millisecond"""
+    timestamp = time.time_ns() // 1_000_000
+    version_suffix = "-lite" if is_lite else ""
+    return os.path.join(REPORT_DIR, f"report-{hostname}-{timestamp}{version_suffix}.json")
+
+
+def _write_report(report: Dict[str, Any], report_path: str) -> None:
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2 if PRETTY_REPORT else 0)
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates in page text, which json escapes but orjson rejects
+            data = None
+        if data is not None:
+            with open(report_path, "wb") as f:
+                f.write(data)
+            return
+    with open(report_path, "w", encoding="utf-8") as f:
+        if PRETTY_REPORT:
+            json.dump(report, f, indent=2)
+        else:
+            json.dump(report, f, separators=(",", ":"))
+
+
+# Report writes still in flight (kept referenced until done; drained on shutdown)
+_pending_report_writes: Set[asyncio.Future] = set()
+
+
+def _persist_report(report: Dict[str, Any], report_path: str) -> None:
+    """Write the report file in the background: the response carries the report, so it doesn't wait for the disk"""
+    future = asyncio.get_running_loop().run_in_executor(REPORT_IO_POOL, _write_report, report, report_path)
+    _pending_report_writes.add(future)
+    future.add_done_callback(_report_written)
+
+
+def _report_written(future: asyncio.Future) -> None:
+    _pending_report_writes.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning(f"⚠️ Failed to save report: {future.exception()}")
+
+
+class CamoufoxBrowserPool:
+    """
+    Keeps a single Camoufox browser alive for the lifetime of the service and
+    hands out a fresh BrowserContext per scan.
+
+    Launching Camoufox (Firefox + fingerprint patching) takes seconds and used
+    to happen on every /audit and /precheck call. A BrowserContext is cheap and
+    fully isolated (cookies, storage, cache), so every scan still starts clean.
+
+    A long-lived Firefox slowly leaks memory, so after ``max_uses`` scans the
+    browser is retired: new scans get a freshly launched browser while the old
+    one is closed as soon as its in-flight scans finish.
+
+    Scans that pass a ``reuse_key`` (e.g. host + device) get their context back
+    warm on the next scan with the same key, keeping TLS sessions, connections,
+    HTTP cache and anti-bot cookies. Idle warm contexts are closed after
+    ``idle_ttl`` seconds so state doesn't pile up.
+    """
+
+    def __init__(self, max_contexts: int, max_uses: int = 0, idle_ttl: float = 600):
+        self._browser = None
+        self._managers: Dict[Any, Any] = {}  # browser -> AsyncCamoufox manager
+        self._active: Dict[Any, int] = {}  # browser -> open contexts
+        self._idle: Dict[Any, Tuple[Any, Any, float]] = {}  # reuse key -> (context, browser, idle since)
+        self._uses = 0
+        self._max_uses = max_uses
+        self._idle_ttl = idle_ttl
+        self._max_idle = max_contexts
+        self._launch_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_contexts)
+
+    async def start(self):
+        """Launch the browser if it is not running yet (or has crashed) and return it."""
+        async with self._launch_lock:
+            if self._browser is not None and not self._browser.is_connected():
+                # Firefox died under us: retire it like a recycled browser
+                logger.warning("⚠️ Camoufox browser disconnected, relaunching")
+                dead, self._browser = self._browser, None
+                if self._active.get(dead) == 0:
+                    await self._close_browser(dead)
+            if self._browser is None:
+                manager = AsyncCamoufox(headless=True)
+                browser = await manager.__aenter__()
+                self._managers[browser] = manager
+                self._active[browser] = 0
+                self._browser = browser
+                self._uses = 0
+                logger.info("🦊 Camoufox browser launched")
+            return self._browser
+
+    async def _close_browser(self, browser):
+        for key, (_, idle_browser, _) in list(self._idle.items()):
+            if idle_browser is browser:
+                del self._idle[key]
+        manager = self._managers.pop(browser, None)
+        self._active.pop(browser, None)
+        if manager is not None:
+            try:
+                await manager.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to close retired Camoufox browser: {e}")
+
+    async def close(self):
+        """Shut every browser down (called on service shutdown)."""
+        async with self._launch_lock:
+            self._browser = None
+            for browser in list(self._managers):
+                await self._close_browser(browser)
+
+    async def _evict_idle(self):
+        """Close warm contexts that sat unused for longer than idle_ttl."""
+        now = time.monotonic()
+        for key, (context, _, idle_since) in list(self._idle.items()):
+            if now - idle_since > self._idle_ttl:
+                del self._idle[key]
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+    @asynccontextmanager
+    async def page(self, **kwargs):
+        """Borrow a new page in a borrowed context (see context()); it is closed afterwards."""
+        async with self.context(**kwargs) as context:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+
+    @asynccontextmanager
+    async def context(self, skip_assets: bool = False, reuse_key: Optional[Tuple] = None,
+                      context_options: Optional[Dict[str, Any]] = None):
+        """
+        Borrow a BrowserContext. Without reuse_key it is fresh and closed when the
+        scan is done; with one, a warm context for that key is reused and kept
+        (the key must cover anything that differs in context_options).
+        With skip_assets, image/media/font/websocket and tracker requests are aborted
+        at the network layer.
+        context_options are passed to new_context() (user agent, viewport, ...).
+        """
+        if reuse_key is not None:
+            reuse_key = (*reuse_key, skip_assets)
+        async with self._slots:
+            await self._evict_idle()
+            browser = await self.start()
+            self._active[browser] += 1
+            self._uses += 1
+            if self._max_uses and self._uses >= self._max_uses and browser is self._browser:
+                # Retire it: the next scan launches a fresh browser
+                logger.info(f"♻️ Recycling Camoufox browser after {self._uses} scans")
+                self._browser = None
+            try:
+                context = None
+                if reuse_key is not None:
+                    # Taken out of the idle map, so one context serves one scan at a time
+                    idle = self._idle.pop(reuse_key, None)
+                    if idle is not None and idle[1] is browser:
+                        context = idle[0]
+                    elif idle is not None:
+                        try:
+                            await idle[0].close()
+                        except Exception:
+                            pass
+                if context is None:
+                    context = await browser.new_context(**(context_options or {}))
+                    if skip_assets:
+                        await context.route("**/*", _abort_heavy_assets)
+                keep = False
+                try:
+                    yield context
+                    keep = reuse_key is not None and browser is self._browser
+                finally:
+                    if keep:
+                        # Keep the warm context, not the scan's pages
+                        try:
+                            for page in context.pages:
+                                await page.close()
+                        except Exception:
+                            keep = False
+                    if keep and reuse_key not in self._idle:
+                        evicted = None
+                        # Bounded like the active contexts: drop the longest-idle one first
+                        if len(self._idle) >= self._max_idle:
+                            evicted = self._idle.pop(next(iter(self._idle)))[0]
+                        self._idle[reuse_key] = (context, browser, time.monotonic())
+                        if evicted is not None:
+                            await evicted.close()
+                    else:
+                        await context.close()
+            finally:
+                self._active[browser] -= 1
+                if browser is not self._browser and self._active[browser] == 0:
+                    await self._close_browser(browser)
+
+
+# Resource types that carry most of a page's bytes but no HTML structure
+HEAVY_RESOURCE_TYPES = frozenset({"image", "media", "font", "websocket"})
+
+# Analytics/ad hosts (and their subdomains): their scripts never change the audited DOM
+TRACKER_HOSTS = frozenset({
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "googleadservices.com", "facebook.net",
+    "hotjar.com", "clarity.ms", "segment.com", "segment.io", "mixpanel.com",
+    "scorecardresearch.com", "quantserve.com", "adnxs.com", "criteo.com",
+    "taboola.com", "outbrain.com", "newrelic.com", "nr-data.net",
+})
+
+
+def _is_tracker(url: str) -> bool:
+    labels = (urlparse(url).hostname or "").split(".")
+    return any(".".join(labels[i:]) in TRACKER_HOSTS for i in range(len(labels) - 1))
+
+
+async def _abort_heavy_assets(route):
+    request = route.request
+    if request.resource_type in HEAVY_RESOURCE_TYPES or _is_tracker(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+browser_pool = CamoufoxBrowserPool(
+    max_contexts=MAX_CONCURRENT_SCANS,
+    max_uses=CAMOUFOX_MAX_USES,
+    idle_ttl=CONTEXT_IDLE_TTL,
+)
 
-# Thread-safe lock for synchronous Camoufox operations
-_precheck_lock = threading.Lock()  # Thread-safe lock for synchronous code
+
+class AuditResultCache:
+    """
+    Small in-process LRU cache with a TTL for successful audit responses.
+
+    Dashboard retries and double submits re-request the same page within
+    seconds; serving those from memory skips the browser and Lighthouse runs.
+    Everything runs on the event loop, so no locking is needed.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] < time.monotonic():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._entries),
+            "maxSize": self._maxsize,
+            "ttlSeconds": self._ttl,
+        }
+
+    def set(self, key, value):
+        if self._ttl <= 0 or self._maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+audit_cache = AuditResultCache(maxsize=AUDIT_CACHE_SIZE, ttl=AUDIT_CACHE_TTL)
+
+
+async def start_browser_pool():
+    """Launch Camoufox once at startup so the first scan doesn't pay for it"""
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        # Not fatal: the pool retries the launch on the first scan
+        logger.warning(f"⚠️ Camoufox launch at startup failed: {e}")
+
+
+async def stop_browser_pool():
+    await browser_pool.close()
+
+
+# Shared httpx client for the precheck fast path, created at startup when httpx is installed
+http_client = None
+
+
+async def start_http_client():
+    global http_client
+    if HTTPX_AVAILABLE:
+        http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+            headers={"User-Agent": DEVICE_CONFIGS["desktop"]["user_agent"]},
+        )
+
+
+async def stop_http_client():
+    if http_client is not None:
+        await http_client.aclose()
+
+
+async def start_lighthouse_daemons():
+    """Spawn the Node Lighthouse workers once instead of a node process per audit"""
+    if not LIGHTHOUSE_AVAILABLE:
+        return
+    try:
+        await start_lighthouse_workers()
+    except Exception as e:
+        # Not fatal: workers are spawned lazily on the first audit
+        logger.warning(f"⚠️ Lighthouse daemon start failed: {e}")
+
+
+async def stop_lighthouse_daemons():
+    if LIGHTHOUSE_AVAILABLE:
+        await close_lighthouse_workers()
+
+
+async def stop_report_io_pool():
+    """Let report writes that are still queued finish before the process exits"""
+    await asyncio.to_thread(REPORT_IO_POOL.shutdown, True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the shared browser, HTTP client and Lighthouse workers once; release them on shutdown"""
+    await start_browser_pool()
+    await start_http_client()
+    await start_lighthouse_daemons()
+    try:
+        yield
+    finally:
+        await stop_browser_pool()
+        await stop_http_client()
+        await stop_lighthouse_daemons()
+        await stop_report_io_pool()
+
+
+app = FastAPI(title="SilverSurfers Python Scanner", version="1.0.0", default_response_class=DefaultResponse, lifespan=lifespan)
 
 
 def safe_text(value: Any) -> str:
@@ -93,10 +562,33 @@ class AuditRequest(BaseModel):
     device: str = "desktop"  # desktop, mobile, tablet
     format: str = "json"  # json or html
     isLiteVersion: bool = False
+    # Skip images/media/fonts and analytics/ad trackers in the custom Camoufox audit
+    # (faster, but contrast/LCP/TBT may differ)
+    skipAssets: bool = False
+    # Run the custom audit in a brand-new context (cold cache, like a first visit).
+    # False reuses the host's warm context: faster, but load metrics see cached resources.
+    freshSession: bool = True
+    # Write the report JSON to REPORT_DIR and return its reportPath. Callers that only
+    # use the inline report can turn this off and skip the disk write entirely.
+    persistReport: bool = True
+
+
+class BatchAuditRequest(BaseModel):
+    urls: List[str]
+    device: str = "desktop"  # desktop, mobile, tablet
+    format: str = "json"  # json or html
+    isLiteVersion: bool = False
+    skipAssets: bool = False
+    freshSession: bool = True
+    persistReport: bool = True
 
 
 class PrecheckRequest(BaseModel):
     url: str
+    # Reachability only needs the document, so heavy assets are skipped by default
+    skipAssets: bool = True
+    # Prechecks reuse the host's warm context unless a clean one is asked for
+    freshSession: bool = False
 
 
 class PrecheckResponse(BaseModel):
@@ -129,6 +621,12 @@ async def health_check():
     return {"status": "healthy", "service": "python-scanner"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Audit cache counters (hit ratio) for monitoring"""
+    return {"auditCache": audit_cache.stats()}
+
+
 # Precheck endpoint
 @app.post("/precheck", response_model=PrecheckResponse)
 async def precheck_url(request: PrecheckRequest):
@@ -137,9 +635,7 @@ async def precheck_url(request: PrecheckRequest):
     This is much faster than a full audit.
     """
     try:
-        # Run precheck in thread pool since it uses sync Camoufox
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, _precheck_url_sync, request.url)
+        result = await _precheck_url(request.url, skip_assets=request.skipAssets, fresh_session=request.freshSession)
         
         return PrecheckResponse(
             success=result.get("success", False),
@@ -155,45 +651,110 @@ async def precheck_url(request: PrecheckRequest):
         )
 
 
+@dataclass(frozen=True, slots=True)
+class AuditRef:
+    """One weighted audit in a scoring category (an entry of its auditRefs)"""
+    id: str
+    weight: int
+
+
 # Configuration matching Node.js custom-config-lite.js
-LITE_AUDIT_REFS = [
-    {"id": "color-contrast", "weight": 5},
-    {"id": "target-size", "weight": 5},
-    {"id": "text-font-audit", "weight": 5},
-    {"id": "viewport", "weight": 3},
-    {"id": "link-name", "weight": 3},
-    {"id": "button-name", "weight": 3},
-    {"id": "label", "weight": 3},
-    {"id": "heading-order", "weight": 2},
-    {"id": "is-on-https", "weight": 2},
-    {"id": "largest-contentful-paint", "weight": 1},
-    {"id": "cumulative-layout-shift", "weight": 1},
-]
+LITE_AUDIT_REFS: Tuple[AuditRef, ...] = (
+    AuditRef("color-contrast", 5),
+    AuditRef("target-size", 5),
+    AuditRef("text-font-audit", 5),
+    AuditRef("viewport", 3),
+    AuditRef("link-name", 3),
+    AuditRef("button-name", 3),
+    AuditRef("label", 3),
+    AuditRef("heading-order", 2),
+    AuditRef("is-on-https", 2),
+    AuditRef("largest-contentful-paint", 1),
+    AuditRef("cumulative-layout-shift", 1),
+)
 
 # Full audit refs (from custom-config.js - MUST MATCH EXACTLY)
-FULL_AUDIT_REFS = [
+FULL_AUDIT_REFS: Tuple[AuditRef, ...] = (
     # Tier 1: Critical (Weight: 10 each)
-    {"id": "color-contrast", "weight": 10},
-    {"id": "target-size", "weight": 10},
-    {"id": "viewport", "weight": 10},
-    {"id": "cumulative-layout-shift", "weight": 10},
-    {"id": "text-font-audit", "weight": 15},
-    {"id": "layout-brittle-audit", "weight": 2},
-    {"id": "flesch-kincaid-audit", "weight": 15},
+    AuditRef("color-contrast", 10),
+    AuditRef("target-size", 10),
+    AuditRef("viewport", 10),
+    AuditRef("cumulative-layout-shift", 10),
+    AuditRef("text-font-audit", 15),
+    AuditRef("layout-brittle-audit", 2),
+    AuditRef("flesch-kincaid-audit", 15),
     # Tier 2: Important (Weight: 5 each)
-    {"id": "largest-contentful-paint", "weight": 5},
-    {"id": "total-blocking-time", "weight": 5},
-    {"id": "link-name", "weight": 5},
-    {"id": "button-name", "weight": 5},
-    {"id": "label", "weight": 5},
-    {"id": "interactive-color-audit", "weight": 5},
+    AuditRef("largest-contentful-paint", 5),
+    AuditRef("total-blocking-time", 5),
+    AuditRef("link-name", 5),
+    AuditRef("button-name", 5),
+    AuditRef("label", 5),
+    AuditRef("interactive-color-audit", 5),
     # Tier 3: Foundational (Weight: 2 each)
-    {"id": "is-on-https", "weight": 2},
-    {"id": "dom-size", "weight": 2},
-    {"id": "heading-order", "weight": 2},
-    {"id": "errors-in-console", "weight": 2},
-    {"id": "geolocation-on-start", "weight": 2},
-]
+    AuditRef("is-on-https", 2),
+    AuditRef("dom-size", 2),
+    AuditRef("heading-order", 2),
+    AuditRef("errors-in-console", 2),
+    AuditRef("geolocation-on-start", 2),
+)
+
+
+# Scoring tables derived once from the refs above, so calculate_score doesn't
+# re-read every ref and re-add the weights on each call
+_LITE_IDS_WEIGHTS = tuple((ref.id, ref.weight) for ref in LITE_AUDIT_REFS)
+_LITE_TOTAL_WEIGHT = sum(weight for _, weight in _LITE_IDS_WEIGHTS)
+_FULL_IDS_WEIGHTS = tuple((ref.id, ref.weight) for ref in FULL_AUDIT_REFS)
+_FULL_TOTAL_WEIGHT = sum(weight for _, weight in _FULL_IDS_WEIGHTS)
+# Weighted sum -> percentage factor (100 / total weight); both totals are non-zero
+_LITE_SCORE_SCALE = 100 / _LITE_TOTAL_WEIGHT
+_FULL_SCORE_SCALE = 100 / _FULL_TOTAL_WEIGHT
+# Stand-in for a missing audit result (read-only, so one shared dict is enough)
+_NO_RESULT: Dict[str, Any] = {}
+
+# Full-version audits this scanner doesn't measure (yet). Their text is constant and
+# they score 0 (not None) so they still count towards the total weight, like the old backend
+_STATIC_FULL_AUDITS = {
+    # Layout brittle audit (checks for fixed-height containers)
+    "layout-brittle-audit": {
+        "id": "layout-brittle-audit",
+        "title": "Containers allow for text spacing adjustments",
+        "description": "This audit checks if containers have fixed heights that may prevent text spacing adjustments (WCAG 1.4.12).",
+        "score": 0.0,
+        "numericValue": 0.0,
+    },
+    # Flesch-Kincaid readability audit
+    "flesch-kincaid-audit": {
+        "id": "flesch-kincaid-audit",
+        "title": "Flesch-Kincaid Reading Ease (Older Adult-Adjusted)",
+        "description": "This audit calculates the Flesch-Kincaid reading ease score with category-based adjustments for older adult users.",
+        "score": 0.0,
+        "numericValue": 0.0,
+    },
+    # Interactive color audit (link color distinction)
+    "interactive-color-audit": {
+        "id": "interactive-color-audit",
+        "title": "Links are visually distinct from surrounding text",
+        "description": "This audit checks if links have a noticeable color difference from surrounding text (Delta E > 10).",
+        "score": 0.0,
+        "numericValue": 0.0,
+    },
+    # Errors in console - check for JavaScript errors
+    "errors-in-console": {
+        "id": "errors-in-console",
+        "title": "No JavaScript errors in console",
+        "description": "This audit checks if there are JavaScript errors in the browser console that could affect functionality.",
+        "score": 0.0,
+        "numericValue": 0.0,
+    },
+}
+
+# JSON form of the refs for the report's category, built once and shared by every report
+_LITE_REFS_JSON = [asdict(ref) for ref in LITE_AUDIT_REFS]
+_FULL_REFS_JSON = [asdict(ref) for ref in FULL_AUDIT_REFS]
+
+# Constant part of the report's category; each report only adds its score
+_LITE_CATEGORY_BASE = {"id": "senior-friendly-lite", "title": "Senior Accessibility (Lite)", "auditRefs": _LITE_REFS_JSON}
+_FULL_CATEGORY_BASE = {"id": "senior-friendly", "title": "Senior Friendliness", "auditRefs": _FULL_REFS_JSON}
 
 
 def calculate_score(report: Dict[str, Any], is_lite: bool = False) -> float:
@@ -210,367 +771,143 @@ def calculate_score(report: Dict[str, Any], is_lite: bool = False) -> float:
         }
         finalScore = (totalWeightedScore / totalWeight) * 100;
     """
-    category_id = "senior-friendly-lite" if is_lite else "senior-friendly"
-    audit_refs = LITE_AUDIT_REFS if is_lite else FULL_AUDIT_REFS
+    if is_lite:
+        ids_weights, score_scale = _LITE_IDS_WEIGHTS, _LITE_SCORE_SCALE
+    else:
+        ids_weights, score_scale = _FULL_IDS_WEIGHTS, _FULL_SCORE_SCALE
     
     audits = report.get("audits", {})
-    total_weighted_score = 0
-    total_weight = 0
     
-    for audit_ref in audit_refs:
-        audit_id = audit_ref["id"]
-        weight = audit_ref["weight"]
-        result = audits.get(audit_id)
-        
-        # EXACT match to old backend's audit.js line 184:
-        # const score = result ? (result.score ?? 0) : 0;
-        score = result.get("score", 0) if result else 0
-        if result and result.get("score") is None:
-            score = 0  # Handle None explicitly (Python equivalent of ?? 0)
-        
-        # EXACT match to old backend's audit.js lines 194-195:
-        total_weighted_score += score * weight
-        total_weight += weight  # ALWAYS add weight, even if audit is missing
+    # EXACT match to old backend's audit.js line 184, for every audit at once:
+    # const score = result ? (result.score ?? 0) : 0;
+    # Summed left to right like the old loop; the total weight behind score_scale is
+    # precomputed and ALWAYS includes every weight, even for missing audits (lines 194-195)
+    total_weighted_score = sum(
+        ((audits.get(audit_id) or _NO_RESULT).get("score") or 0) * weight
+        for audit_id, weight in ids_weights
+    )
     
-    # EXACT match to old backend's audit.js line 209:
-    final_score = (total_weighted_score / total_weight * 100) if total_weight > 0 else 0
-    return round(final_score, 2)
+    # Old backend's audit.js line 209 (totalWeightedScore / totalWeight) * 100, with the
+    # division folded into score_scale; rounding (not truncating) to 2 decimals as before
+    return round(total_weighted_score * score_scale, 2)
+
+
+# Device emulation settings, built once (callers only read them)
+DEVICE_CONFIGS = {
+    "desktop": {
+        "viewport": {"width": 1920, "height": 1080},
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        "device_scale_factor": 1,
+        "is_mobile": False,
+        "has_touch": False,
+    },
+    "tablet": {
+        # Samsung Galaxy Tab S8 (common tablet size)
+        "viewport": {"width": 800, "height": 1280},
+        "user_agent": "Mozilla/5.0 (Linux; Android 12; SM-X906B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        "device_scale_factor": 2,
+        "is_mobile": True,
+        "has_touch": True,
+    },
+    "mobile": {
+        # Samsung Galaxy S23
+        "viewport": {"width": 360, "height": 780},
+        "user_agent": "Mozilla/5.0 (Linux; Android 13; SM-S911B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Mobile Safari/537.36",
+        "device_scale_factor": 3,
+        "is_mobile": True,
+        "has_touch": True,
+    },
+}
+
+
+def _build_context_options(device_config: Dict[str, Any]) -> Dict[str, Any]:
+    """new_context() keyword arguments that emulate the device (Firefox has no is_mobile)."""
+    return {
+        "user_agent": device_config["user_agent"],
+        "viewport": device_config["viewport"],
+        "device_scale_factor": device_config["device_scale_factor"],
+        "has_touch": device_config["has_touch"],
+    }
+
+
+def _build_init_script(device_config: Dict[str, Any]) -> str:
+    """Navigator overrides the context options can't express; added to pages before navigation."""
+    # navigator.platform has to agree with the user agent (Windows desktop, Android mobile)
+    is_mobile = device_config.get("is_mobile", False)
+    platform_value = 'Linux armv8l' if is_mobile else 'Win32'
+    script = f"""
+        // Override platform
+        Object.defineProperty(navigator, 'platform', {{
+            get: () => '{platform_value}',
+            configurable: true
+        }});
+    """
+    if is_mobile:
+        script += """
+        // Override hardware concurrency for mobile devices
+        Object.defineProperty(navigator, 'hardwareConcurrency', {
+            get: () => 8,
+            configurable: true
+        });
+    """
+    return script
+
+
+# Device emulation only depends on the device, so build it once and store it
+# with its config instead of re-creating it for every page
+for _device_config in DEVICE_CONFIGS.values():
+    _device_config["context_options"] = _build_context_options(_device_config)
+    _device_config["init_script"] = _build_init_script(_device_config)
 
 
 def get_viewport_for_device(device: str = "desktop") -> Dict[str, Any]:
     """Get viewport and device emulation configuration for device type"""
-    device_configs = {
-        "desktop": {
-            "viewport": {"width": 1920, "height": 1080},
-            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "device_scale_factor": 1,
-            "is_mobile": False,
-            "has_touch": False,
-        },
-        "tablet": {
-            # Samsung Galaxy Tab S8 (common tablet size)
-            "viewport": {"width": 800, "height": 1280},
-            "user_agent": "Mozilla/5.0 (Linux; Android 12; SM-X906B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-            "device_scale_factor": 2,
-            "is_mobile": True,
-            "has_touch": True,
-        },
-        "mobile": {
-            # Samsung Galaxy S23
-            "viewport": {"width": 360, "height": 780},
-            "user_agent": "Mozilla/5.0 (Linux; Android 13; SM-S911B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Mobile Safari/537.36",
-            "device_scale_factor": 3,
-            "is_mobile": True,
-            "has_touch": True,
-        },
-    }
-    return device_configs.get(device, device_configs["desktop"])
+    return DEVICE_CONFIGS.get(device, DEVICE_CONFIGS["desktop"])
 
 
-async def perform_accessibility_audit(page, url: str, is_lite: bool = False) -> Dict[str, Any]:
+async def _wait_for_settle(page, timeout_ms: int, state: str = "networkidle") -> None:
     """
-    Perform accessibility audit using Camoufox (Playwright-compatible) and return Lighthouse-compatible format
+    Wait for the page to reach `state` (network-idle by default), for at most `timeout_ms`.
+    Replaces fixed sleeps: quiet pages continue as soon as they settle, busy
+    pages (analytics, long polling) still continue once the old delay is up.
     """
-    # Navigate to page
     try:
-        response = await page.goto(url, wait_until="networkidle", timeout=60000)
-        if response and response.status >= 400:
-            if response.status == 403:
-                # Wait a bit, content might still load
-                await asyncio.sleep(3)
-                content = await page.content()
-                if len(content) < 1000:
-                    raise Exception(f"HTTP {response.status}: Insufficient content")
-            else:
-                raise Exception(f"HTTP {response.status}: Failed to load page")
-    except Exception as e:
-        raise Exception(f"Navigation failed: {str(e)}")
-    
-    # Wait for page to settle
-    await asyncio.sleep(2)
-    
-    # Get page content and parse with BeautifulSoup
-    html_content = await page.content()
-    soup = BeautifulSoup(html_content, "lxml")
-    
-    # Get final URL after redirects
-    final_url = page.url
-    
-    # Perform audits (simplified version - in production, use axe-core or similar)
-    audits = {}
-    
-    # Color contrast (simplified check)
-    audits["color-contrast"] = {
-        "id": "color-contrast",
-        "title": "Background and foreground colors have a sufficient contrast ratio",
-        "score": 0.9,  # Placeholder - would need actual contrast calculation
-        "numericValue": 0.9,
-    }
-    
-    # Target size (check for small clickable elements)
-    small_targets = await page.evaluate("""
-        () => {
-            const elements = document.querySelectorAll('a, button, input[type="button"], input[type="submit"]');
-            let smallCount = 0;
-            elements.forEach(el => {
-                const rect = el.getBoundingClientRect();
-                if (rect.width < 44 || rect.height < 44) smallCount++;
-            });
-            return { total: elements.length, small: smallCount };
-        }
-    """)
-    target_score = 1.0 if small_targets["small"] == 0 else max(0, 1 - (small_targets["small"] / max(small_targets["total"], 1)))
-    audits["target-size"] = {
-        "id": "target-size",
-        "title": "Touch targets have sufficient size and spacing",
-        "score": target_score,
-        "numericValue": target_score,
-    }
-    
-    # Viewport meta tag
-    viewport_meta = soup.find("meta", attrs={"name": "viewport"})
-    has_viewport = viewport_meta is not None
-    audits["viewport"] = {
-        "id": "viewport",
-        "title": "Has a `<meta name=\"viewport\">` tag with `width` or `initial-scale`",
-        "score": 1.0 if has_viewport else 0.0,
-        "numericValue": 1.0 if has_viewport else 0.0,
-    }
-    
-    # Link names
-    links_without_text = await page.evaluate("""
-        () => {
-            const links = Array.from(document.querySelectorAll('a'));
-            return links.filter(link => {
-                const text = link.textContent.trim();
-                const ariaLabel = link.getAttribute('aria-label');
-                const title = link.getAttribute('title');
-                return !text && !ariaLabel && !title;
-            }).length;
-        }
-    """)
-    total_links = len(soup.find_all("a"))
-    link_score = 1.0 if total_links == 0 else max(0, 1 - (links_without_text / max(total_links, 1)))
-    audits["link-name"] = {
-        "id": "link-name",
-        "title": "Links have a discernible name",
-        "score": link_score,
-        "numericValue": link_score,
-    }
-    
-    # Button names
-    buttons_without_text = await page.evaluate("""
-        () => {
-            const buttons = Array.from(document.querySelectorAll('button, input[type="button"], input[type="submit"]'));
-            return buttons.filter(btn => {
-                const text = btn.textContent.trim();
-                const ariaLabel = btn.getAttribute('aria-label');
-                const value = btn.getAttribute('value');
-                return !text && !ariaLabel && !value;
-            }).length;
-        }
-    """)
-    total_buttons = len(soup.find_all(["button", "input"]))
-    button_score = 1.0 if total_buttons == 0 else max(0, 1 - (buttons_without_text / max(total_buttons, 1)))
-    audits["button-name"] = {
-        "id": "button-name",
-        "title": "Buttons have an accessible name",
-        "score": button_score,
-        "numericValue": button_score,
-    }
-    
-    # Form labels
-    inputs_without_labels = await page.evaluate("""
-        () => {
-            const inputs = Array.from(document.querySelectorAll('input, textarea, select'));
-            return inputs.filter(input => {
-                const id = input.id;
-                const name = input.name;
-                const label = document.querySelector(`label[for="${id}"]`);
-                const ariaLabel = input.getAttribute('aria-label');
-                const placeholder = input.getAttribute('placeholder');
-                return !label && !ariaLabel && !placeholder;
-            }).length;
-        }
-    """)
-    total_inputs = len(soup.find_all(["input", "textarea", "select"]))
-    label_score = 1.0 if total_inputs == 0 else max(0, 1 - (inputs_without_labels / max(total_inputs, 1)))
-    audits["label"] = {
-        "id": "label",
-        "title": "Form elements have associated labels",
-        "score": label_score,
-        "numericValue": label_score,
-    }
-    
-    # Heading order
-    heading_order_valid = await page.evaluate("""
-        () => {
-            const headings = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6'));
-            let lastLevel = 0;
-            for (const heading of headings) {
-                const level = parseInt(heading.tagName[1]);
-                if (level > lastLevel + 1) return false;
-                lastLevel = level;
-            }
-            return true;
-        }
-    """)
-    audits["heading-order"] = {
-        "id": "heading-order",
-        "title": "Heading elements appear in a sequentially-descending order",
-        "score": 1.0 if heading_order_valid else 0.0,
-        "numericValue": 1.0 if heading_order_valid else 0.0,
-    }
-    
-    # HTTPS check
-    is_https = urlparse(final_url).scheme == "https"
-    audits["is-on-https"] = {
-        "id": "is-on-https",
-        "title": "Uses HTTPS",
-        "score": 1.0 if is_https else 0.0,
-        "numericValue": 1.0 if is_https else 0.0,
-    }
-    
-    # Text font audit (simplified - check for small text)
-    small_text_count = await page.evaluate("""
-        () => {
-            const elements = document.querySelectorAll('p, span, div, li, td, th, a, button, label');
-            let smallCount = 0;
-            elements.forEach(el => {
-                const style = window.getComputedStyle(el);
-                const fontSize = parseFloat(style.fontSize);
-                if (fontSize < 16) smallCount++;
-            });
-            return smallCount;
-        }
-    """)
-    total_text_elements = len(soup.find_all(["p", "span", "div", "li", "td", "th", "a", "button", "label"]))
-    text_score = 1.0 if total_text_elements == 0 else max(0, 1 - (small_text_count / max(total_text_elements, 1)))
-    audits["text-font-audit"] = {
-        "id": "text-font-audit",
-        "title": "Text is appropriately sized for readability",
-        "score": text_score,
-        "numericValue": text_score,
-    }
-    
-    # Performance metrics (simplified)
-    performance_metrics = await page.evaluate("""
-        () => {
-            const perf = performance.timing;
-            const paint = performance.getEntriesByType('paint');
-            const lcp = paint.find(p => p.name === 'largest-contentful-paint');
-            return {
-                loadTime: perf.loadEventEnd - perf.navigationStart,
-                lcp: lcp ? lcp.startTime : 0
-            };
-        }
-    """)
-    
-    # Largest Contentful Paint (LCP) - good if < 2.5s
-    lcp_score = 1.0 if performance_metrics.get("lcp", 0) < 2500 else max(0, 1 - (performance_metrics.get("lcp", 0) - 2500) / 2500)
-    audits["largest-contentful-paint"] = {
-        "id": "largest-contentful-paint",
-        "title": "Largest Contentful Paint",
-        "score": lcp_score,
-        "numericValue": performance_metrics.get("lcp", 0),
-    }
-    
-    # Cumulative Layout Shift (CLS) - simplified
-    audits["cumulative-layout-shift"] = {
-        "id": "cumulative-layout-shift",
-        "title": "Cumulative Layout Shift",
-        "score": 0.9,  # Placeholder - would need actual CLS measurement
-        "numericValue": 0.1,
-    }
-    
-    # Build Lighthouse-compatible report
-    category_id = "senior-friendly-lite" if is_lite else "senior-friendly"
-    category_title = "Senior Accessibility (Lite)" if is_lite else "Senior Friendliness"
-    
-    final_score = calculate_score({"audits": audits}, is_lite)
-    
-    report = {
-        "lighthouseVersion": "10.0.0",
-        "fetchTime": time.time() * 1000,
-        "requestedUrl": url,
-        "finalUrl": final_url,
-        "categories": {
-            category_id: {
-                "id": category_id,
-                "title": category_title,
-                "score": final_score / 100,
-                "auditRefs": LITE_AUDIT_REFS if is_lite else FULL_AUDIT_REFS,
-            }
-        },
-        "audits": audits,
-    }
-    
-    return report
+        await page.wait_for_load_state(state, timeout=timeout_ms)
+    except Exception:
+        pass
 
 
-def _launch_camoufox_and_get_cdp(url: str, device_config: Dict[str, Any]) -> Dict[str, Any]:
+async def _launch_camoufox_and_get_cdp(url: str, device_config: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Launch Camoufox, navigate to URL (bypassing bot protection), and return final URL.
+    Navigate to URL with Camoufox (bypassing bot protection), and return final URL.
     This allows Lighthouse to audit the same URL that Camoufox successfully loaded.
     
-    Note: Getting CDP endpoint from Playwright sync API is complex, so we use URL-based approach:
+    Note: Getting CDP endpoint from Playwright is complex, so we use URL-based approach:
     Camoufox navigates and bypasses bots, then Lighthouse audits the verified URL.
+    Only the final URL is needed here, so images/media/fonts are not downloaded.
     """
     try:
-        # Use Camoufox context manager
-        with Camoufox(headless=True) as browser:
-            page = browser.new_page()
-            
-            # Set viewport and device emulation
-            viewport = device_config.get("viewport", {"width": 1920, "height": 1080})
-            page.set_viewport_size(viewport)
-            
-            user_agent = device_config.get("user_agent")
-            device_scale_factor = device_config.get("device_scale_factor", 1)
-            is_mobile = device_config.get("is_mobile", False)
-            has_touch = device_config.get("has_touch", False)
+        # Borrow an isolated context from the shared Camoufox browser
+        # Reuse the host's warm context: anti-bot cookies and connections carry over
+        reuse_key = (urlparse(url).netloc, device_config.get("user_agent"))
+        async with browser_pool.context(skip_assets=True, reuse_key=reuse_key,
+                                        context_options=device_config["context_options"]) as context:
+            page = await context.new_page()
+            browser = context.browser
             
-            if user_agent:
-                context = page.context
-                context.set_extra_http_headers({"User-Agent": user_agent})
-            
-            # Device emulation script
-            touch_value = 1 if has_touch else 0
-            platform_value = 'Linux armv8l' if is_mobile else 'Win32'
-            mobile_bool = 'true' if is_mobile else 'false'
-            
-            page.add_init_script(f"""
-                Object.defineProperty(navigator, 'userAgent', {{
-                    get: () => '{user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}',
-                    configurable: true
-                }});
-                Object.defineProperty(navigator, 'maxTouchPoints', {{
-                    get: () => {touch_value},
-                    configurable: true
-                }});
-                Object.defineProperty(window, 'devicePixelRatio', {{
-                    get: () => {device_scale_factor},
-                    configurable: true
-                }});
-                Object.defineProperty(navigator, 'platform', {{
-                    get: () => '{platform_value}',
-                    configurable: true
-                }});
-                if ({mobile_bool}) {{
-                    Object.defineProperty(navigator, 'hardwareConcurrency', {{
-                        get: () => 8,
-                        configurable: true
-                    }});
-                }}
-            """)
+            # Device emulation (user agent, viewport, touch) is set on the context
+            await page.add_init_script(device_config["init_script"])
             
             # Navigate to URL (this bypasses bot protection)
-            print(f"   🕷️ Camoufox navigating to {url}...")
-            page.goto(url, wait_until="load", timeout=120000)
-            page.wait_for_timeout(3000)  # Wait for dynamic content and anti-bot checks
+            logger.info(f"   🕷️ Camoufox navigating to {url}...")
+            # Only the final URL is needed: don't block on slow subresources,
+            # give the load event a short grace period instead
+            await page.goto(url, wait_until="domcontentloaded", timeout=120000)
+            await _wait_for_settle(page, 5000, "load")
+            await _wait_for_settle(page, 3000)  # Wait for dynamic content and anti-bot checks
             
             final_url = page.url
-            print(f"   ✅ Successfully navigated to: {final_url}")
+            logger.info(f"   ✅ Successfully navigated to: {final_url}")
             
             # Try to get CDP endpoint from browser
             # Playwright stores this in browser._browser._connection._ws._url
@@ -586,7 +923,6 @@ def _launch_camoufox_and_get_cdp(url: str, device_config: Dict[str, Any]) -> Dic
                 
                 # If still not found, try accessing via context
                 if not cdp_endpoint:
-                    context = page.context
                     browser_context = getattr(context, '_browser_context', None)
                     if browser_context and hasattr(browser_context, '_connection'):
                         conn = browser_context._connection
@@ -594,17 +930,16 @@ def _launch_camoufox_and_get_cdp(url: str, device_config: Dict[str, Any]) -> Dic
                             ws = conn._ws
                             cdp_endpoint = getattr(ws, '_url', None) or getattr(ws, 'url', None)
             except Exception as e:
-                print(f"   ⚠️ Could not extract CDP endpoint: {e}")
-                print(f"   ℹ️ Will use URL-based approach instead")
+                logger.warning(f"   ⚠️ Could not extract CDP endpoint: {e}")
+                logger.info("   ℹ️ Will use URL-based approach instead")
             
             # Return result - if we have CDP endpoint, use it; otherwise return URL for Lighthouse
-            # Note: Since we're using context manager, browser will close when we exit
-            # For CDP connection, we'd need to keep browser alive, but that's complex with Playwright sync API
+            # Note: Camoufox is Firefox, so Lighthouse can't attach to it over CDP anyway
             # So we'll use the URL-based approach: Camoufox verifies the URL is accessible, Lighthouse audits it
-            print(f"   ℹ️ Using URL-based approach: Lighthouse will audit {final_url}")
+            logger.info(f"   ℹ️ Using URL-based approach: Lighthouse will audit {final_url}")
             return {
                 "success": True,
-                "cdp_endpoint": None,  # CDP extraction is complex with Playwright sync API
+                "cdp_endpoint": None,  # Lighthouse can't drive Camoufox (Firefox) over CDP
                 "url": final_url
             }
     except Exception as e:
@@ -614,902 +949,870 @@ def _launch_camoufox_and_get_cdp(url: str, device_config: Dict[str, Any]) -> Dic
         }
 
 
-def _run_camoufox_audit_sync(url: str, device_config: Dict[str, Any], is_lite: bool, get_cdp_endpoint: bool = False) -> Dict[str, Any]:
-    """
-    Synchronous wrapper for Camoufox audit.
-    This runs in a thread pool to avoid blocking the async event loop.
-    Camoufox uses Playwright's sync API, so we need to run it in a separate thread.
+# WCAG contrast ratios for a sample of text elements (up to 100, full calculation is
+# expensive). Runs inside COMBINED_AUDIT_JS.
+COLOR_CONTRAST_JS = """
+() => {
+    // Helper function to calculate relative luminance
+    function getLuminance(r, g, b) {
+        const rs = r / 255;
+        const gs = g / 255;
+        const bs = b / 255;
+        const rLinear = rs <= 0.03928 ? rs / 12.92 : Math.pow((rs + 0.055) / 1.055, 2.4);
+        const gLinear = gs <= 0.03928 ? gs / 12.92 : Math.pow((gs + 0.055) / 1.055, 2.4);
+        const bLinear = bs <= 0.03928 ? bs / 12.92 : Math.pow((bs + 0.055) / 1.055, 2.4);
+        return 0.2126 * rLinear + 0.7152 * gLinear + 0.0722 * bLinear;
+    }
     
-    Args:
-        url: URL to audit
-        device_config: Device configuration (viewport, user agent, etc.)
-        is_lite: Whether to use lite version
-        get_cdp_endpoint: If True, return CDP endpoint instead of running audits (for Lighthouse integration)
+    // Helper function to calculate contrast ratio
+    function getContrastRatio(color1, color2) {
+        const lum1 = getLuminance(color1.r, color1.g, color1.b);
+        const lum2 = getLuminance(color2.r, color2.g, color2.b);
+        const lighter = Math.max(lum1, lum2);
+        const darker = Math.min(lum1, lum2);
+        return (lighter + 0.05) / (darker + 0.05);
+    }
     
-    Returns:
-        If get_cdp_endpoint=True: {"success": True, "cdp_endpoint": "ws://..."}
-        Otherwise: {"success": True, "report": {...}, "score": ...}
-    """
-    # Use Camoufox for advanced anti-detection (sync API)
-    # Note: viewport is set on the page, not in the browser constructor
-    with Camoufox(headless=True) as browser:
-        # Get a page from the browser (sync API)
-        page = browser.new_page()
-        
-        # Set viewport and device emulation for the page
-        viewport = device_config.get("viewport", {"width": 1920, "height": 1080})
-        page.set_viewport_size(viewport)
+    // Helper to parse color string to RGB
+    function parseColor(colorStr) {
+        if (!colorStr || colorStr === 'transparent') return null;
+        const rgbMatch = colorStr.match(/rgba?\\((\\d+),\\s*(\\d+),\\s*(\\d+)(?:,\\s*([\\d.]+))?\\)/);
+        if (rgbMatch) {
+            return { r: parseInt(rgbMatch[1]), g: parseInt(rgbMatch[2]), b: parseInt(rgbMatch[3]) };
+        }
+        return null;
+    }
+    
+    // Sample text elements (limit to 100 for performance)
+    const textElements = [];
+    const allElements = document.querySelectorAll('p, span, div, li, td, th, a, button, label, h1, h2, h3, h4, h5, h6');
+    const maxSamples = Math.min(100, allElements.length);
+    
+    for (let i = 0; i < maxSamples; i++) {
+        const el = allElements[i];
+        if (!el.offsetParent) continue; // Skip hidden elements
         
-        # Get device emulation settings
-        user_agent = device_config.get("user_agent")
-        device_scale_factor = device_config.get("device_scale_factor", 1)
-        is_mobile = device_config.get("is_mobile", False)
-        has_touch = device_config.get("has_touch", False)
+        const style = window.getComputedStyle(el);
+        const fontSize = parseFloat(style.fontSize);
+        const fontWeight = parseInt(style.fontWeight) || (style.fontWeight === 'bold' ? 700 : 400);
+        const isLargeText = fontSize >= 18 || (fontSize >= 14 && fontWeight >= 700);
+        const minRatio = isLargeText ? 3.0 : 4.5; // WCAG AA standards
         
-        # Set user agent via context (more reliable)
-        if user_agent:
-            context = page.context
-            context.set_extra_http_headers({"User-Agent": user_agent})
+        const fgColor = parseColor(style.color);
+        let bgColor = parseColor(style.backgroundColor);
         
-        # Emulate device characteristics via JavaScript injection before navigation
-        # This must be done before goto() to ensure proper emulation
-        touch_value = 1 if has_touch else 0
-        platform_value = 'Linux armv8l' if is_mobile else 'Win32'
-        mobile_bool = 'true' if is_mobile else 'false'
+        // If background is transparent, check parent (up to 3 levels)
+        if (!bgColor || (bgColor.r === 0 && bgColor.g === 0 && bgColor.b === 0 && style.backgroundColor.includes('rgba(0, 0, 0, 0)'))) {
+            let parentEl = el.parentElement;
+            let levels = 0;
+            while (parentEl && levels < 3 && !bgColor) {
+                const parentStyle = window.getComputedStyle(parentEl);
+                bgColor = parseColor(parentStyle.backgroundColor);
+                if (bgColor && bgColor.r > 0 && bgColor.g > 0 && bgColor.b > 0) break;
+                parentEl = parentEl.parentElement;
+                levels++;
+            }
+        }
         
-        page.add_init_script(f"""
-            // Override user agent
-            Object.defineProperty(navigator, 'userAgent', {{
-                get: () => '{user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}',
-                configurable: true
-            }});
-            
-            // Override max touch points for touch support
-            Object.defineProperty(navigator, 'maxTouchPoints', {{
-                get: () => {touch_value},
-                configurable: true
-            }});
-            
-            // Override device pixel ratio
-            Object.defineProperty(window, 'devicePixelRatio', {{
-                get: () => {device_scale_factor},
-                configurable: true
-            }});
-            
-            // Override platform
-            Object.defineProperty(navigator, 'platform', {{
-                get: () => '{platform_value}',
-                configurable: true
-            }});
-            
-            // Override hardware concurrency for mobile devices
-            if ({mobile_bool}) {{
-                Object.defineProperty(navigator, 'hardwareConcurrency', {{
-                    get: () => 8,
-                    configurable: true
-                }});
-            }}
-        """)
+        // Default to white if no background found
+        if (!bgColor) {
+            bgColor = { r: 255, g: 255, b: 255 };
+        }
         
-        try:
-            # Navigate to the URL (sync) - use "load" instead of "networkidle" for better reliability
-            # "networkidle" can timeout on sites with continuous network activity
-            page.goto(url, wait_until="load", timeout=120000)  # 2 minutes timeout
-            
-            # Wait a bit for dynamic content (sync)
-            page.wait_for_timeout(2000)
-            
-            # Get page content (sync)
-            html_content = page.content()
-            page_url = page.url
-            
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'lxml')
-            
-            # Get final URL after redirects
-            final_url = page_url
-            
-            # Perform audits using sync Playwright API
-            audits = {}
-            
-            # Color contrast - calculate actual WCAG contrast ratios
-            # Old backend uses Lighthouse's built-in color-contrast audit (binary: pass/fail)
-            # We'll sample text elements and calculate contrast ratios
-            # Note: Full calculation is expensive, so we sample up to 100 elements
-            try:
-                color_contrast_results = page.evaluate("""
-                    () => {
-                        // Helper function to calculate relative luminance
-                        function getLuminance(r, g, b) {
-                            const rs = r / 255;
-                            const gs = g / 255;
-                            const bs = b / 255;
-                            const rLinear = rs <= 0.03928 ? rs / 12.92 : Math.pow((rs + 0.055) / 1.055, 2.4);
-                            const gLinear = gs <= 0.03928 ? gs / 12.92 : Math.pow((gs + 0.055) / 1.055, 2.4);
-                            const bLinear = bs <= 0.03928 ? bs / 12.92 : Math.pow((bs + 0.055) / 1.055, 2.4);
-                            return 0.2126 * rLinear + 0.7152 * gLinear + 0.0722 * bLinear;
-                        }
-                        
-                        // Helper function to calculate contrast ratio
-                        function getContrastRatio(color1, color2) {
-                            const lum1 = getLuminance(color1.r, color1.g, color1.b);
-                            const lum2 = getLuminance(color2.r, color2.g, color2.b);
-                            const lighter = Math.max(lum1, lum2);
-                            const darker = Math.min(lum1, lum2);
-                            return (lighter + 0.05) / (darker + 0.05);
-                        }
-                        
-                        // Helper to parse color string to RGB
-                        function parseColor(colorStr) {
-                            if (!colorStr || colorStr === 'transparent') return null;
-                            const rgbMatch = colorStr.match(/rgba?\\((\\d+),\\s*(\\d+),\\s*(\\d+)(?:,\\s*([\\d.]+))?\\)/);
-                            if (rgbMatch) {
-                                return { r: parseInt(rgbMatch[1]), g: parseInt(rgbMatch[2]), b: parseInt(rgbMatch[3]) };
-                            }
-                            return null;
-                        }
-                        
-                        // Sample text elements (limit to 100 for performance)
-                        const textElements = [];
-                        const allElements = document.querySelectorAll('p, span, div, li, td, th, a, button, label, h1, h2, h3, h4, h5, h6');
-                        const maxSamples = Math.min(100, allElements.length);
-                        
-                        for (let i = 0; i < maxSamples; i++) {
-                            const el = allElements[i];
-                            if (!el.offsetParent) continue; // Skip hidden elements
-                            
-                            const style = window.getComputedStyle(el);
-                            const fontSize = parseFloat(style.fontSize);
-                            const fontWeight = parseInt(style.fontWeight) || (style.fontWeight === 'bold' ? 700 : 400);
-                            const isLargeText = fontSize >= 18 || (fontSize >= 14 && fontWeight >= 700);
-                            const minRatio = isLargeText ? 3.0 : 4.5; // WCAG AA standards
-                            
-                            const fgColor = parseColor(style.color);
-                            let bgColor = parseColor(style.backgroundColor);
-                            
-                            // If background is transparent, check parent (up to 3 levels)
-                            if (!bgColor || (bgColor.r === 0 && bgColor.g === 0 && bgColor.b === 0 && style.backgroundColor.includes('rgba(0, 0, 0, 0)'))) {
-                                let parentEl = el.parentElement;
-                                let levels = 0;
-                                while (parentEl && levels < 3 && !bgColor) {
-                                    const parentStyle = window.getComputedStyle(parentEl);
-                                    bgColor = parseColor(parentStyle.backgroundColor);
-                                    if (bgColor && bgColor.r > 0 && bgColor.g > 0 && bgColor.b > 0) break;
-                                    parentEl = parentEl.parentElement;
-                                    levels++;
-                                }
-                            }
-                            
-                            // Default to white if no background found
-                            if (!bgColor) {
-                                bgColor = { r: 255, g: 255, b: 255 };
-                            }
-                            
-                            if (fgColor && bgColor) {
-                                const ratio = getContrastRatio(fgColor, bgColor);
-                                textElements.push({
-                                    ratio: ratio,
-                                    minRequired: minRatio,
-                                    passes: ratio >= minRatio
-                                });
-                            }
-                        }
-                        
-                        const total = textElements.length;
-                        const passing = textElements.filter(e => e.passes).length;
-                        const failing = total - passing;
-                        
-                        return {
-                            total: total,
-                            passing: passing,
-                            failing: failing,
-                            score: total > 0 ? passing / total : 1.0
-                        };
-                    }
-                """)
-                
-                contrast_score = color_contrast_results.get("score", 1.0) if color_contrast_results else 1.0
-                failing_count = color_contrast_results.get("failing", 0) if color_contrast_results else 0
-                total_count = color_contrast_results.get("total", 0) if color_contrast_results else 0
-            except Exception as e:
-                print(f"⚠️ Color contrast calculation failed: {e}")
-                contrast_score = 1.0
-                failing_count = 0
-                total_count = 0
-            
-            audits["color-contrast"] = {
-                "id": "color-contrast",
-                "title": "Background and foreground colors have a sufficient contrast ratio",
-                "description": f"This audit checks whether text and background colors have sufficient contrast for readability. Found {failing_count} elements with insufficient contrast out of {total_count} sampled text elements.",
-                "score": contrast_score,
-                "numericValue": contrast_score,
-                "scoreDisplayMode": "numeric" if contrast_score < 1.0 else "binary",
-            }
-            
-            # Target size (check for small clickable elements) - sync eval with details
-            target_size_results = page.evaluate("""
-                () => {
-                    const elements = document.querySelectorAll('a, button, input[type="button"], input[type="submit"]');
-                    const smallItems = [];
-                    elements.forEach(el => {
-                        const rect = el.getBoundingClientRect();
-                        if (rect.width < 44 || rect.height < 44) {
-                            smallItems.push({
-                                node: {
-                                    nodeLabel: el.textContent.trim().substring(0, 50) || el.tagName.toLowerCase(),
-                                    selector: el.tagName.toLowerCase() + (el.id ? '#' + el.id : '') + (el.className ? '.' + el.className.split(' ')[0] : ''),
-                                    path: el.tagName.toLowerCase()
-                                },
-                                width: Math.round(rect.width),
-                                height: Math.round(rect.height)
-                            });
-                        }
-                    });
-                    return { total: elements.length, small: smallItems.length, items: smallItems.slice(0, 50) };
-                }
-            """)
-            target_score = 1.0 if target_size_results["small"] == 0 else max(0, 1 - (target_size_results["small"] / max(target_size_results["total"], 1)))
-            
-            target_details_items = []
-            if target_size_results.get("items"):
-                for item in target_size_results["items"]:
-                    target_details_items.append({
-                        "node": item.get("node", {}),
-                        "width": item.get("width", 0),
-                        "height": item.get("height", 0)
-                    })
-            
-            audits["target-size"] = {
-                "id": "target-size",
-                "title": "Touch targets have sufficient size and spacing",
-                "description": f"This audit checks if interactive elements (buttons, links) are large enough for easy clicking. Found {target_size_results['small']} small targets out of {target_size_results['total']} total interactive elements.",
-                "score": target_score,
-                "numericValue": target_score,
-            }
-            
-            if target_details_items:
-                audits["target-size"]["details"] = {
-                    "type": "table",
-                    "headings": [
-                        {"key": "node", "itemType": "node", "text": "Element"},
-                        {"key": "width", "itemType": "numeric", "text": "Width"},
-                        {"key": "height", "itemType": "numeric", "text": "Height"}
-                    ],
-                    "items": target_details_items
-                }
-            
-            # Viewport meta tag
-            viewport_meta = soup.find("meta", attrs={"name": "viewport"})
-            has_viewport = viewport_meta is not None
-            audits["viewport"] = {
-                "id": "viewport",
-                "title": "Has a `<meta name=\"viewport\">` tag with `width` or `initial-scale`",
-                "description": "This audit checks if the page has a proper viewport meta tag for mobile devices. A viewport tag ensures the page displays correctly on tablets and phones.",
-                "score": 1.0 if has_viewport else 0.0,
-                "numericValue": 1.0 if has_viewport else 0.0,
-            }
-            
-            # Link names - sync eval with details
-            link_name_results = page.evaluate("""
-                () => {
-                    const links = Array.from(document.querySelectorAll('a'));
-                    const failingItems = [];
-                    links.forEach(link => {
-                        const text = link.textContent.trim();
-                        const ariaLabel = link.getAttribute('aria-label');
-                        const title = link.getAttribute('title');
-                        if (!text && !ariaLabel && !title) {
-                            failingItems.push({
-                                node: {
-                                    nodeLabel: link.href || 'Link',
-                                    selector: link.tagName.toLowerCase() + (link.id ? '#' + link.id : '') + (link.className ? '.' + link.className.split(' ')[0] : ''),
-                                    path: link.tagName.toLowerCase()
-                                }
-                            });
-                        }
-                    });
-                    return { total: links.length, failing: failingItems.length, items: failingItems.slice(0, 50) };
-                }
-            """)
-            link_score = 1.0 if link_name_results["total"] == 0 else max(0, 1 - (link_name_results["failing"] / max(link_name_results["total"], 1)))
-            
-            link_details_items = []
-            if link_name_results.get("items"):
-                for item in link_name_results["items"]:
-                    link_details_items.append({
-                        "node": item.get("node", {})
-                    })
-            
-            audits["link-name"] = {
-                "id": "link-name",
-                "title": "Links have a discernible name",
-                "description": f"This audit checks if all links have descriptive text. Found {link_name_results['failing']} links without text out of {link_name_results['total']} total links.",
-                "score": link_score,
-                "numericValue": link_score,
-            }
-            
-            if link_details_items:
-                audits["link-name"]["details"] = {
-                    "type": "table",
-                    "headings": [
-                        {"key": "node", "itemType": "node", "text": "Element"},
-                        {"key": "selector", "itemType": "code", "text": "Location"}
-                    ],
-                    "items": link_details_items
-                }
-            
-            # Button names - sync eval with details
-            button_name_results = page.evaluate("""
-                () => {
-                    const buttons = Array.from(document.querySelectorAll('button, input[type="button"], input[type="submit"]'));
-                    const failingItems = [];
-                    buttons.forEach(btn => {
-                        const text = btn.textContent.trim();
-                        const ariaLabel = btn.getAttribute('aria-label');
-                        const value = btn.getAttribute('value');
-                        if (!text && !ariaLabel && !value) {
-                            failingItems.push({
-                                node: {
-                                    nodeLabel: btn.tagName.toLowerCase(),
-                                    selector: btn.tagName.toLowerCase() + (btn.id ? '#' + btn.id : '') + (btn.className ? '.' + btn.className.split(' ')[0] : ''),
-                                    path: btn.tagName.toLowerCase()
-                                }
-                            });
-                        }
-                    });
-                    return { total: buttons.length, failing: failingItems.length, items: failingItems.slice(0, 50) };
-                }
-            """)
-            button_score = 1.0 if button_name_results["total"] == 0 else max(0, 1 - (button_name_results["failing"] / max(button_name_results["total"], 1)))
-            
-            button_details_items = []
-            if button_name_results.get("items"):
-                for item in button_name_results["items"]:
-                    button_details_items.append({
-                        "node": item.get("node", {})
-                    })
-            
-            audits["button-name"] = {
-                "id": "button-name",
-                "title": "Buttons have an accessible name",
-                "description": f"This audit checks if all buttons have descriptive labels. Found {button_name_results['failing']} buttons without text out of {button_name_results['total']} total buttons.",
-                "score": button_score,
-                "numericValue": button_score,
+        if (fgColor && bgColor) {
+            const ratio = getContrastRatio(fgColor, bgColor);
+            textElements.push({
+                ratio: ratio,
+                minRequired: minRatio,
+                passes: ratio >= minRatio
+            });
+        }
+    }
+    
+    const total = textElements.length;
+    const passing = textElements.filter(e => e.passes).length;
+    const failing = total - passing;
+    
+    return {
+        total: total,
+        passing: passing,
+        failing: failing,
+        score: total > 0 ? passing / total : 1.0
+    };
+}
+"""
+
+
+# Element-level checks of the custom audit in a single page.evaluate(): one round-trip
+# to the browser and one walk over the DOM instead of a query + evaluate per audit.
+COMBINED_AUDIT_JS = """
+(isLite) => {
+    const measureColorContrast = """ + COLOR_CONTRAST_JS.strip() + """;
+    const TEXT_TAGS = new Set(['p', 'span', 'div', 'li', 'td', 'th', 'a', 'button', 'label']);
+    // Reports only show this many items per audit; past it only the counts are kept
+    const MAX_ITEMS = 50;
+    // Font sizes are looked up for at most this many elements; on bigger pages the
+    // share of small text in that sample is extrapolated to the rest
+    const FONT_CHECK_BUDGET = 2000;
+    const selectorOf = (el) => {
+        const cls = el.getAttribute('class');
+        return el.tagName.toLowerCase() + (el.id ? '#' + el.id : '') + (cls ? '.' + cls.split(' ')[0] : '');
+    };
+
+    const targetSize = { total: 0, small: 0, items: [] };
+    const linkName = { total: 0, failing: 0, items: [] };
+    const buttonName = { total: 0, failing: 0, items: [] };
+    const textFont = { total: 0, small: 0, items: [], checked: 0, sampled: 0 };
+    const inputs = [];
+    const labelledIds = new Set();
+    let headingOrder = true;
+    let lastLevel = 0;
+    // Live collection: no static snapshot of every node is built (nothing is mutated during the walk)
+    const allElements = document.getElementsByTagName('*');
+    for (let i = 0, n = allElements.length; i < n; i++) {
+        const el = allElements[i];
+        const tag = el.localName;
+        let isTarget = false;
+        let isButton = false;
+        // textContent walks the whole subtree, so read it at most once per element
+        let text;
+
+        if (tag === 'a') {
+            isTarget = true;
+            linkName.total++;
+            if (!(text ??= el.textContent.trim()) && !el.getAttribute('aria-label') && !el.getAttribute('title')) {
+                linkName.failing++;
+                if (linkName.items.length < MAX_ITEMS) linkName.items.push({
+                    node: { nodeLabel: el.href || 'Link', selector: selectorOf(el), path: tag }
+                });
             }
-            
-            if button_details_items:
-                audits["button-name"]["details"] = {
-                    "type": "table",
-                    "headings": [
-                        {"key": "node", "itemType": "node", "text": "Element"},
-                        {"key": "selector", "itemType": "code", "text": "Location"}
-                    ],
-                    "items": button_details_items
-                }
-            
-            # Form labels - sync eval with details
-            label_results = page.evaluate("""
-                () => {
-                    const inputs = Array.from(document.querySelectorAll('input, textarea, select'));
-                    const failingItems = [];
-                    inputs.forEach(input => {
-                        const id = input.id;
-                        const name = input.name;
-                        const label = document.querySelector(`label[for="${id}"]`);
-                        const ariaLabel = input.getAttribute('aria-label');
-                        const placeholder = input.getAttribute('placeholder');
-                        if (!label && !ariaLabel && !placeholder) {
-                            failingItems.push({
-                                node: {
-                                    nodeLabel: input.tagName.toLowerCase() + (input.type ? '[' + input.type + ']' : ''),
-                                    selector: input.tagName.toLowerCase() + (input.id ? '#' + input.id : '') + (input.className ? '.' + input.className.split(' ')[0] : ''),
-                                    path: input.tagName.toLowerCase()
-                                }
-                            });
-                        }
-                    });
-                    return { total: inputs.length, failing: failingItems.length, items: failingItems.slice(0, 50) };
-                }
-            """)
-            label_score = 1.0 if label_results["total"] == 0 else max(0, 1 - (label_results["failing"] / max(label_results["total"], 1)))
-            
-            label_details_items = []
-            if label_results.get("items"):
-                for item in label_results["items"]:
-                    label_details_items.append({
-                        "node": item.get("node", {})
-                    })
-            
-            audits["label"] = {
-                "id": "label",
-                "title": "Form elements have associated labels",
-                "description": f"This audit checks if all form inputs have associated labels. Found {label_results['failing']} inputs without labels out of {label_results['total']} total inputs.",
-                "score": label_score,
-                "numericValue": label_score,
+        } else if (tag === 'button') {
+            isTarget = isButton = true;
+        } else if (tag === 'input') {
+            const type = (el.getAttribute('type') || '').toLowerCase();
+            isTarget = isButton = type === 'button' || type === 'submit';
+            inputs.push(el);
+        } else if (tag === 'textarea' || tag === 'select') {
+            inputs.push(el);
+        } else if (tag === 'label') {
+            if (el.hasAttribute('for')) labelledIds.add(el.htmlFor);
+        } else if (headingOrder && tag.length === 2 && tag.charCodeAt(0) === 104) {
+            // h1-h6 (level from the digit); stops being checked after the first skipped level
+            const level = tag.charCodeAt(1) - 48;
+            if (level >= 1 && level <= 6) {
+                if (level > lastLevel + 1) headingOrder = false;
+                lastLevel = level;
             }
-            
-            if label_details_items:
-                audits["label"]["details"] = {
-                    "type": "table",
-                    "headings": [
-                        {"key": "node", "itemType": "node", "text": "Element"},
-                        {"key": "selector", "itemType": "code", "text": "Location"}
-                    ],
-                    "items": label_details_items
-                }
-            
-            # Heading order - sync eval
-            heading_order_valid = page.evaluate("""
-                () => {
-                    const headings = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6'));
-                    let lastLevel = 0;
-                    for (const heading of headings) {
-                        const level = parseInt(heading.tagName[1]);
-                        if (level > lastLevel + 1) return false;
-                        lastLevel = level;
-                    }
-                    return true;
-                }
-            """)
-            audits["heading-order"] = {
-                "id": "heading-order",
-                "title": "Heading elements appear in a sequentially-descending order",
-                "description": "This audit checks if headings follow a logical order (H1, then H2, then H3, etc.). Proper heading structure helps screen readers and improves content organization.",
-                "score": 1.0 if heading_order_valid else 0.0,
-                "numericValue": 1.0 if heading_order_valid else 0.0,
+        }
+
+        if (isTarget) {
+            targetSize.total++;
+            const rect = el.getBoundingClientRect();
+            if (rect.width < 44 || rect.height < 44) {
+                targetSize.small++;
+                if (targetSize.items.length < MAX_ITEMS) targetSize.items.push({
+                    node: {
+                        nodeLabel: (text ??= el.textContent.trim()).substring(0, 50) || tag,
+                        selector: selectorOf(el),
+                        path: tag
+                    },
+                    width: Math.round(rect.width),
+                    height: Math.round(rect.height)
+                });
             }
-            
-            # HTTPS check
-            is_https = urlparse(final_url).scheme == "https"
-            audits["is-on-https"] = {
-                "id": "is-on-https",
-                "title": "Uses HTTPS",
-                "description": "This audit checks if the page is served over HTTPS. HTTPS encrypts data and provides security for users.",
-                "score": 1.0 if is_https else 0.0,
-                "numericValue": 1.0 if is_https else 0.0,
+        }
+
+        if (isButton) {
+            buttonName.total++;
+            if (!(text ??= el.textContent.trim()) && !el.getAttribute('aria-label') && !el.getAttribute('value')) {
+                buttonName.failing++;
+                if (buttonName.items.length < MAX_ITEMS) buttonName.items.push({
+                    node: { nodeLabel: tag, selector: selectorOf(el), path: tag }
+                });
             }
-            
-            # Text font audit - sync eval with detailed items
-            text_font_results = page.evaluate("""
-                () => {
-                    const elements = document.querySelectorAll('p, span, div, li, td, th, a, button, label');
-                    const failingItems = [];
-                    elements.forEach(el => {
-                        const style = window.getComputedStyle(el);
-                        const fontSize = parseFloat(style.fontSize);
-                        if (fontSize < 16 && el.textContent.trim()) {
-                            failingItems.push({
-                                textSnippet: el.textContent.trim().substring(0, 100) || 'Text element',
-                                containerSelector: el.tagName.toLowerCase() + (el.id ? '#' + el.id : '') + (el.className ? '.' + el.className.split(' ')[0] : ''),
-                                fontSize: fontSize.toFixed(1) + 'px'
-                            });
-                        }
+        }
+
+        if (TEXT_TAGS.has(tag)) {
+            textFont.total++;
+            // Empty elements can't fail, so only elements with text pay for a style lookup
+            if (textFont.checked < FONT_CHECK_BUDGET && (text ??= el.textContent.trim())) {
+                if (++textFont.checked === FONT_CHECK_BUDGET) textFont.sampled = textFont.total;
+                // Looked up per element: :nth-child, attribute and :lang rules can give
+                // otherwise identical siblings different sizes
+                const fontSize = parseFloat(window.getComputedStyle(el).fontSize);
+                if (fontSize < 16) {
+                    textFont.small++;
+                    // Short keys keep the reply small: t = text snippet, c = container selector, f = font size
+                    if (textFont.items.length < MAX_ITEMS) textFont.items.push({
+                        t: text.substring(0, 60),
+                        c: selectorOf(el),
+                        f: fontSize.toFixed(1) + 'px'
                     });
-                    return {
-                        total: elements.length,
-                        small: failingItems.length,
-                        items: failingItems.slice(0, 50)  // Limit to 50 items for performance
-                    };
-                }
-            """)
-            total_text_elements = text_font_results.get("total", 0)
-            small_text_count = text_font_results.get("small", 0)
-            text_score = 1.0 if total_text_elements == 0 else max(0, 1 - (small_text_count / max(total_text_elements, 1)))
-            
-            # Build details.items for table generation
-            text_details_items = []
-            if text_font_results.get("items"):
-                for item in text_font_results["items"]:
-                    text_details_items.append({
-                        "textSnippet": item.get("textSnippet", "Text element"),
-                        "containerSelector": item.get("containerSelector", "N/A"),
-                        "fontSize": item.get("fontSize", "N/A")
-                    })
-            
-            audits["text-font-audit"] = {
-                "id": "text-font-audit",
-                "title": "Text is appropriately sized for readability",
-                "description": f"This audit checks if text is large enough for readability. Found {small_text_count} text elements with font size less than 16px out of {total_text_elements} total text elements.",
-                "score": text_score,
-                "numericValue": text_score,
-            }
-            
-            # Add details.items if there are failing items
-            if text_details_items:
-                audits["text-font-audit"]["details"] = {
-                    "type": "table",
-                    "headings": [
-                        {"key": "textSnippet", "itemType": "text", "text": "Text Content"},
-                        {"key": "containerSelector", "itemType": "code", "text": "Element Selector"},
-                        {"key": "fontSize", "itemType": "text", "text": "Reason"}
-                    ],
-                    "items": text_details_items
                 }
-            
-            # Performance metrics - sync eval
-            performance_metrics = page.evaluate("""
-                () => {
-                    const perf = performance.timing;
-                    const paint = performance.getEntriesByType('paint');
-                    const lcp = paint.find(p => p.name === 'largest-contentful-paint');
-                    return {
-                        loadTime: perf.loadEventEnd - perf.navigationStart,
-                        lcp: lcp ? lcp.startTime : 0
-                    };
-                }
-            """)
-            
-            # Largest Contentful Paint (LCP)
-            lcp_score = 1.0 if performance_metrics.get("lcp", 0) < 2500 else max(0, 1 - (performance_metrics.get("lcp", 0) - 2500) / 2500)
-            audits["largest-contentful-paint"] = {
-                "id": "largest-contentful-paint",
-                "title": "Largest Contentful Paint",
-                "description": f"This audit measures how long it takes for the main content to load. LCP time: {performance_metrics.get('lcp', 0):.0f}ms. Good if under 2500ms.",
-                "score": lcp_score,
-                "numericValue": performance_metrics.get("lcp", 0),
-            }
-            
-            # Cumulative Layout Shift (CLS) - measure actual CLS from performance entries
-            # Note: CLS is measured during page load, so we read from existing performance entries
-            try:
-                cls_result = page.evaluate("""
-                    () => {
-                        let clsValue = 0;
-                        let clsEntries = [];
-                        
-                        try {
-                            // Read buffered layout-shift entries
-                            const entries = performance.getEntriesByType('layout-shift');
-                            for (const entry of entries) {
-                                if (!entry.hadRecentInput) {
-                                    clsValue += entry.value;
-                                    clsEntries.push({
-                                        value: entry.value,
-                                        startTime: entry.startTime
-                                    });
-                                }
-                            }
-                            
-                            // Lighthouse CLS scoring: 0.1 = good, 0.25 = needs improvement, 0.25+ = poor
-                            // Score: 1.0 if CLS <= 0.1, linear decrease to 0 if CLS >= 0.25
-                            let score = 1.0;
-                            if (clsValue > 0.1) {
-                                if (clsValue >= 0.25) {
-                                    score = 0;
-                                } else {
-                                    score = 1 - ((clsValue - 0.1) / 0.15);
-                                }
-                            }
-                            
-                            return {
-                                cls: clsValue,
-                                score: Math.max(0, Math.min(1, score)),
-                                entries: clsEntries.length
-                            };
-                        } catch (e) {
-                            // Fallback if Performance API not available
-                            return {
-                                cls: 0,
-                                score: 1.0,
-                                entries: 0,
-                                error: e.message
-                            };
-                        }
-                    }
-                """)
-                
-                cls_data = cls_result if isinstance(cls_result, dict) else {"cls": 0, "score": 1.0, "entries": 0}
-                cls_score = cls_data.get("score", 1.0)
-                cls_value = cls_data.get("cls", 0)
-            except Exception as e:
-                print(f"⚠️ CLS calculation failed: {e}")
-                cls_score = 1.0
-                cls_value = 0
-            
-            audits["cumulative-layout-shift"] = {
-                "id": "cumulative-layout-shift",
-                "title": "Cumulative Layout Shift",
-                "description": f"This audit measures visual stability. CLS value: {cls_value:.3f}. A low CLS score means the page layout is stable and doesn't shift unexpectedly, which is important for older adults.",
-                "score": cls_score,
-                "numericValue": cls_value,
             }
-            
-            # Missing audits - set to 0 (not None) so they're included in weight calculation
-            # CRITICAL: Must use 0, not None, to match old backend behavior
-            # The old backend returns 0 for missing audits, which are included in total weight
-            # If we use None, pdf_generator.js filters them out, reducing total weight
-            if not is_lite:
-                # Layout brittle audit (checks for fixed-height containers)
-                audits["layout-brittle-audit"] = {
-                    "id": "layout-brittle-audit",
-                    "title": "Containers allow for text spacing adjustments",
-                    "description": "This audit checks if containers have fixed heights that may prevent text spacing adjustments (WCAG 1.4.12).",
-                    "score": 0.0,  # Set to 0 (not None) so it's included in weight calculation
-                    "numericValue": 0.0,
-                }
-                
-                # Flesch-Kincaid readability audit
-                audits["flesch-kincaid-audit"] = {
-                    "id": "flesch-kincaid-audit",
-                    "title": "Flesch-Kincaid Reading Ease (Older Adult-Adjusted)",
-                    "description": "This audit calculates the Flesch-Kincaid reading ease score with category-based adjustments for older adult users.",
-                    "score": 0.0,  # Set to 0 (not None) so it's included in weight calculation
-                    "numericValue": 0.0,
-                }
-                
-                # Total Blocking Time (TBT) - measure actual TBT from performance entries
-                # Note: TBT requires Long Tasks API which may not be available, so we estimate from load time
-                try:
-                    tbt_result = page.evaluate("""
-                        () => {
-                            let totalBlockingTime = 0;
-                            
-                            try {
-                                // Try to read buffered longtask entries
-                                const longTasks = performance.getEntriesByType('longtask');
-                                for (const entry of longTasks) {
-                                    // TBT is the sum of blocking time (time > 50ms) for all long tasks
-                                    const blockingTime = entry.duration - 50;
-                                    if (blockingTime > 0) {
-                                        totalBlockingTime += blockingTime;
-                                    }
-                                }
-                                
-                                // If no long tasks found, estimate from load time
-                                if (totalBlockingTime === 0) {
-                                    const perf = performance.timing;
-                                    const loadTime = perf.loadEventEnd - perf.navigationStart;
-                                    // Rough estimate: assume some blocking during load (10% of load time over 2s)
-                                    totalBlockingTime = Math.max(0, (loadTime - 2000) * 0.1);
-                                }
-                                
-                                // Lighthouse TBT scoring: 200ms = good, 600ms = needs improvement, 600ms+ = poor
-                                // Score: 1.0 if TBT <= 200ms, linear decrease to 0 if TBT >= 600ms
-                                let score = 1.0;
-                                if (totalBlockingTime > 200) {
-                                    if (totalBlockingTime >= 600) {
-                                        score = 0;
-                                    } else {
-                                        score = 1 - ((totalBlockingTime - 200) / 400);
-                                    }
-                                }
-                                
-                                return {
-                                    tbt: totalBlockingTime,
-                                    score: Math.max(0, Math.min(1, score)),
-                                    longTasks: longTasks.length
-                                };
-                            } catch (e) {
-                                // Fallback: estimate from load time
-                                const perf = performance.timing;
-                                const loadTime = perf.loadEventEnd - perf.navigationStart;
-                                const estimatedTBT = Math.max(0, (loadTime - 2000) * 0.1);
-                                let score = 1.0;
-                                if (estimatedTBT > 200) {
-                                    if (estimatedTBT >= 600) {
-                                        score = 0;
-                                    } else {
-                                        score = 1 - ((estimatedTBT - 200) / 400);
-                                    }
-                                }
-                                return {
-                                    tbt: estimatedTBT,
-                                    score: Math.max(0, Math.min(1, score)),
-                                    longTasks: 0,
-                                    estimated: true
-                                };
-                            }
-                        }
-                    """)
-                    
-                    tbt_data = tbt_result if isinstance(tbt_result, dict) else {"tbt": 0, "score": 1.0, "longTasks": 0}
-                    tbt_score = tbt_data.get("score", 1.0)
-                    tbt_value = tbt_data.get("tbt", 0)
-                except Exception as e:
-                    print(f"⚠️ TBT calculation failed: {e}")
-                    tbt_score = 1.0
-                    tbt_value = 0
-                
-                audits["total-blocking-time"] = {
-                    "id": "total-blocking-time",
-                    "title": "Total Blocking Time",
-                    "description": f"This audit measures the total amount of time that a page is blocked from responding to user input. TBT: {tbt_value:.0f}ms. Lower is better.",
-                    "score": tbt_score,
-                    "numericValue": tbt_value,
-                }
-                
-                # Interactive color audit (link color distinction)
-                audits["interactive-color-audit"] = {
-                    "id": "interactive-color-audit",
-                    "title": "Links are visually distinct from surrounding text",
-                    "description": "This audit checks if links have a noticeable color difference from surrounding text (Delta E > 10).",
-                    "score": 0.0,  # Set to 0 (not None) so it's included in weight calculation
-                    "numericValue": 0.0,
-                }
-                
-                # DOM size audit
-                dom_size = page.evaluate("() => document.querySelectorAll('*').length")
-                dom_size_score = 1.0 if dom_size < 1500 else max(0, 1 - (dom_size - 1500) / 1500)
-                
-                # Get sample DOM elements for detailed findings table
-                # Get top-level elements and navigation items as examples
-                sample_elements = page.evaluate("""
-                    () => {
-                        const elements = [];
-                        // Get navigation links
-                        const navLinks = Array.from(document.querySelectorAll('nav a, header a, .nav a, .navigation a')).slice(0, 10);
-                        navLinks.forEach(link => {
-                            const text = link.textContent.trim().substring(0, 50);
-                            if (text) {
-                                // Build selector
-                                let selector = link.tagName.toLowerCase();
-                                if (link.id) {
-                                    selector += '#' + link.id;
-                                } else if (link.className) {
-                                    const firstClass = link.className.split(' ')[0];
-                                    if (firstClass) selector += '.' + firstClass;
-                                }
-                                elements.push({
-                                    nodeLabel: text || 'Navigation Link',
-                                    selector: selector,
-                                    explanation: 'May impact older adult users'
-                                });
-                            }
-                        });
-                        // Get some divs with complex nesting (potential complexity issues)
-                        const complexDivs = Array.from(document.querySelectorAll('div[class*="relative"], div[class*="absolute"]')).slice(0, 5);
-                        complexDivs.forEach(div => {
-                            const depth = div.querySelectorAll('*').length;
-                            if (depth > 5) {
-                                let selector = div.tagName.toLowerCase();
-                                if (div.id) {
-                                    selector += '#' + div.id;
-                                } else if (div.className) {
-                                    const firstClass = div.className.split(' ')[0];
-                                    if (firstClass) selector += '.' + firstClass;
-                                }
-                                elements.push({
-                                    nodeLabel: selector,
-                                    selector: selector,
-                                    explanation: 'May impact older adult users'
-                                });
-                            }
-                        });
-                        return elements.slice(0, 10); // Limit to 10 items
-                    }
-                """)
-                
-                # Build details.items in the format expected by PDF generator's default table config
-                # Default config expects: item.node?.nodeLabel, item.node?.selector, item.explanation
-                details_items = []
-                if sample_elements:
-                    for elem in sample_elements:
-                        details_items.append({
-                            "node": {
-                                "nodeLabel": elem.get("nodeLabel", "Page Element"),
-                                "selector": elem.get("selector", "N/A")
-                            },
-                            "explanation": elem.get("explanation", "May impact older adult users")
-                        })
-                
-                audits["dom-size"] = {
-                    "id": "dom-size",
-                    "title": "Avoids an excessive DOM size",
-                    "description": f"This audit checks if the page has a reasonable number of DOM elements. Found {dom_size} elements. Recommended: under 1500.",
-                    "score": dom_size_score,
-                    "numericValue": dom_size,
-                    "displayValue": f"{dom_size} elements",
-                    "details": {
-                        "type": "table",
-                        "items": details_items
-                    } if details_items else None
-                }
-                
-                # Errors in console - check for JavaScript errors
-                # Set to 0 (not None) so it's included in weight calculation
-                audits["errors-in-console"] = {
-                    "id": "errors-in-console",
-                    "title": "No JavaScript errors in console",
-                    "description": "This audit checks if there are JavaScript errors in the browser console that could affect functionality.",
-                    "score": 0.0,  # Set to 0 (not None) so it's included in weight calculation
-                    "numericValue": 0.0,
-                }
-                
-                # Geolocation on start - check if page requests geolocation immediately
-                geolocation_requested = page.evaluate("""
-                    () => {
-                        // Check if geolocation API was called
-                        // This would need to be monitored during page load
-                        return false;
-                    }
-                """)
-                audits["geolocation-on-start"] = {
-                    "id": "geolocation-on-start",
-                    "title": "Does not request geolocation on page load",
-                    "description": "This audit checks if the page requests user location immediately on load, which can be intrusive for older adults.",
-                    "score": 1.0 if not geolocation_requested else 0.0,
-                    "numericValue": 1.0 if not geolocation_requested else 0.0,
+        }
+    }
+
+    textFont.truncated = textFont.sampled > 0 && textFont.sampled < textFont.total;
+    if (textFont.truncated) {
+        textFont.small = Math.round(textFont.small * textFont.total / textFont.sampled);
+    }
+
+    // Labels can come after their inputs, so inputs are checked once every label is known
+    const label = { total: inputs.length, failing: 0, items: [] };
+    for (const input of inputs) {
+        if (!labelledIds.has(input.id) && !input.getAttribute('aria-label') && !input.getAttribute('placeholder')) {
+            label.failing++;
+            if (label.items.length < MAX_ITEMS) label.items.push({
+                node: {
+                    nodeLabel: input.tagName.toLowerCase() + (input.type ? '[' + input.type + ']' : ''),
+                    selector: selectorOf(input),
+                    path: input.tagName.toLowerCase()
                 }
-            
-            # Build Lighthouse-compatible report
-            category_id = "senior-friendly-lite" if is_lite else "senior-friendly"
-            category_title = "Senior Accessibility (Lite)" if is_lite else "Senior Friendliness"
-            
-            final_score = calculate_score({"audits": audits}, is_lite)
-            
-            report = {
-                "lighthouseVersion": "10.0.0",
-                "fetchTime": time.time() * 1000,
-                "requestedUrl": url,
-                "finalUrl": final_url,
-                "categories": {
-                    category_id: {
-                        "id": category_id,
-                        "title": category_title,
-                        "score": final_score / 100,
-                        "auditRefs": LITE_AUDIT_REFS if is_lite else FULL_AUDIT_REFS,
-                    }
-                },
-                "audits": audits
-            }
-            
-            return {
-                "success": True,
-                "report": report,
-                "score": final_score
+            });
+        }
+    }
+
+    const perf = performance.timing;
+    const loadTime = perf.loadEventEnd - perf.navigationStart;
+    const lcp = performance.getEntriesByType('paint').find(p => p.name === 'largest-contentful-paint');
+
+    // Cumulative Layout Shift from the buffered layout-shift entries (CLS is measured
+    // during page load). Lighthouse CLS scoring: 0.1 = good, 0.25+ = poor, linear in between
+    let cls;
+    try {
+        let clsValue = 0;
+        let clsEntries = 0;
+        for (const entry of performance.getEntriesByType('layout-shift')) {
+            if (!entry.hadRecentInput) {
+                clsValue += entry.value;
+                clsEntries++;
             }
-            
-        finally:
-            page.close()
+        }
+        let score = 1.0;
+        if (clsValue > 0.1) {
+            score = clsValue >= 0.25 ? 0 : 1 - ((clsValue - 0.1) / 0.15);
+        }
+        cls = { cls: clsValue, score: Math.max(0, Math.min(1, score)), entries: clsEntries };
+    } catch (e) {
+        // Fallback if Performance API not available
+        cls = { cls: 0, score: 1.0, entries: 0, error: e.message };
+    }
+
+    // A failed contrast calculation shouldn't fail the other audits
+    let colorContrast = null;
+    try {
+        colorContrast = measureColorContrast();
+    } catch (e) {
+        colorContrast = { error: e.message };
+    }
+
+    const result = {
+        colorContrast: colorContrast,
+        targetSize: targetSize,
+        linkName: linkName,
+        buttonName: buttonName,
+        label: label,
+        headingOrder: headingOrder,
+        textFont: textFont,
+        perf: { loadTime: loadTime, lcp: lcp ? lcp.startTime : 0 },
+        viewportMeta: document.querySelector('meta[name="viewport"]') !== null,
+        cls: cls
+    };
+    if (isLite) return result;
+
+    // Total Blocking Time: sum of (duration - 50ms) over long tasks. The Long Tasks API
+    // may not be available, so fall back to an estimate from the load time
+    // (10% of load time over 2s). Lighthouse TBT scoring: 200ms = good, 600ms+ = poor
+    let totalBlockingTime = 0;
+    let longTasks = 0;
+    try {
+        const entries = performance.getEntriesByType('longtask');
+        longTasks = entries.length;
+        for (const entry of entries) {
+            const blockingTime = entry.duration - 50;
+            if (blockingTime > 0) totalBlockingTime += blockingTime;
+        }
+    } catch (e) {
+        longTasks = 0;
+    }
+    if (totalBlockingTime === 0) {
+        totalBlockingTime = Math.max(0, (loadTime - 2000) * 0.1);
+    }
+    let tbtScore = 1.0;
+    if (totalBlockingTime > 200) {
+        tbtScore = totalBlockingTime >= 600 ? 0 : 1 - ((totalBlockingTime - 200) / 400);
+    }
+    result.tbt = { tbt: totalBlockingTime, score: Math.max(0, Math.min(1, tbtScore)), longTasks: longTasks };
+
+    // DOM size is the element count the walk above already visited
+    result.domSize = allElements.length;
+
+    // Sample elements for the DOM size findings table: navigation links and
+    // nested positioned divs (potential complexity issues)
+    const sampleSelector = (el) => {
+        let selector = el.tagName.toLowerCase();
+        if (el.id) {
+            selector += '#' + el.id;
+        } else if (el.className) {
+            const firstClass = el.className.split(' ')[0];
+            if (firstClass) selector += '.' + firstClass;
+        }
+        return selector;
+    };
+    const sample = [];
+    for (const link of Array.from(document.querySelectorAll('nav a, header a, .nav a, .navigation a')).slice(0, 10)) {
+        const text = link.textContent.trim().substring(0, 50);
+        if (text) {
+            sample.push({ nodeLabel: text, selector: sampleSelector(link), explanation: 'May impact older adult users' });
+        }
+    }
+    for (const div of Array.from(document.querySelectorAll('div[class*="relative"], div[class*="absolute"]')).slice(0, 5)) {
+        if (div.getElementsByTagName('*').length > 5) {
+            const selector = sampleSelector(div);
+            sample.push({ nodeLabel: selector, selector: selector, explanation: 'May impact older adult users' });
+        }
+    }
+    result.sampleElements = sample.slice(0, 10);
+
+    // Geolocation on start: the geolocation API would have to be monitored during
+    // page load, which isn't done, so it is never reported as requested
+    result.geolocationRequested = false;
+    return result;
+}
+"""
+
+
+async def _run_camoufox_audit(url: str, device_config: Dict[str, Any], is_lite: bool, skip_assets: bool = False, fresh_session: bool = True) -> Dict[str, Any]:
+    """
+    Run the custom Camoufox audit on a page borrowed from the shared browser.
+    Uses Playwright's async API, so audits run concurrently on the event loop
+    without a thread per request.
+    
+    Args:
+        url: URL to audit
+        device_config: Device configuration (viewport, user agent, etc.)
+        is_lite: Whether to use lite version
+        skip_assets: Abort image/media/font/websocket and tracker requests while auditing
+        fresh_session: Audit in a new context (cold cache); False reuses the host's warm context
+    
+    Returns:
+        {"success": True, "report": {...}, "score": ...}
+    """
+    # Use Camoufox for advanced anti-detection (shared browser, isolated context)
+    reuse_key = None if fresh_session else (urlparse(url).netloc, device_config.get("user_agent"))
+    async with browser_pool.page(skip_assets=skip_assets, reuse_key=reuse_key,
+                                 context_options=device_config["context_options"]) as page:
+        return await _audit_page(page, url, device_config, is_lite)
+
+
+async def _audit_page(page, url: str, device_config: Dict[str, Any], is_lite: bool) -> Dict[str, Any]:
+    """
+    Navigate `page` to `url` and run the custom audits on it.
+    The caller owns the page (and its context) and closes it afterwards.
+    """
+    # User agent, viewport and touch come from the context options; the remaining
+    # overrides must be added before goto() to ensure proper emulation
+    await page.add_init_script(device_config["init_script"])
+    
+    # Navigate to the URL - the probes only need the parsed DOM, so don't wait for
+    # "load"/"networkidle" (slow subresources and analytics just add idle wall-time)
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    # Best-effort like the other waits: a stalled parser or client-side redirect must not
+    # fail the audit when the DOM is already usable
+    await _wait_for_settle(page, 5000, "domcontentloaded")
+    
+    # Best-effort: give the load event a short window so the load-time/LCP sample is filled in
+    await _wait_for_settle(page, 3000, "load")
+    
+    # All page measurements: one evaluate, one DOM walk (see COMBINED_AUDIT_JS)
+    probe = await page.evaluate(COMBINED_AUDIT_JS, is_lite)
+    
+    # Final URL after redirects
+    return _build_report(probe, page.url, url, is_lite)
+
+
+def _build_report(probe: Dict[str, Any], final_url: str, url: str, is_lite: bool) -> Dict[str, Any]:
+    """
+    Score the COMBINED_AUDIT_JS measurements and wrap them in a Lighthouse-compatible report.
+    Pure Python: every page read happens in the probe, so this never touches the browser.
+    """
+    audits = {}
+    
+    # Color contrast - calculate actual WCAG contrast ratios
+    # Old backend uses Lighthouse's built-in color-contrast audit (binary: pass/fail)
+    # We'll sample text elements and calculate contrast ratios
+    # Note: Full calculation is expensive, so we sample up to 100 elements
+    color_contrast_results = probe["colorContrast"]
+    if color_contrast_results and "error" not in color_contrast_results:
+        contrast_score = color_contrast_results.get("score", 1.0)
+        failing_count = color_contrast_results.get("failing", 0)
+        total_count = color_contrast_results.get("total", 0)
+    else:
+        logger.warning(f"⚠️ Color contrast calculation failed: {(color_contrast_results or {}).get('error')}")
+        contrast_score = 1.0
+        failing_count = 0
+        total_count = 0
+    
+    audits["color-contrast"] = {
+        "id": "color-contrast",
+        "title": "Background and foreground colors have a sufficient contrast ratio",
+        "description": f"This audit checks whether text and background colors have sufficient contrast for readability. Found {failing_count} elements with insufficient contrast out of {total_count} sampled text elements.",
+        "score": contrast_score,
+        "numericValue": contrast_score,
+        "scoreDisplayMode": "numeric" if contrast_score < 1.0 else "binary",
+    }
+    
+    # Target size (check for small clickable elements) - with details
+    target_size_results = probe["targetSize"]
+    target_score = max(0.0, 1 - target_size_results["small"] / max(target_size_results["total"], 1))
+    
+    target_details_items = []
+    if target_size_results.get("items"):
+        for item in target_size_results["items"]:
+            target_details_items.append({
+                "node": item.get("node", {}),
+                "width": item.get("width", 0),
+                "height": item.get("height", 0)
+            })
+    
+    audits["target-size"] = {
+        "id": "target-size",
+        "title": "Touch targets have sufficient size and spacing",
+        "description": f"This audit checks if interactive elements (buttons, links) are large enough for easy clicking. Found {target_size_results['small']} small targets out of {target_size_results['total']} total interactive elements.",
+        "score": target_score,
+        "numericValue": target_score,
+    }
+    
+    if target_details_items:
+        audits["target-size"]["details"] = {
+            "type": "table",
+            "headings": [
+                {"key": "node", "itemType": "node", "text": "Element"},
+                {"key": "width", "itemType": "numeric", "text": "Width"},
+                {"key": "height", "itemType": "numeric", "text": "Height"}
+            ],
+            "items": target_details_items
+        }
+    
+    # Viewport meta tag
+    has_viewport = probe["viewportMeta"]
+    audits["viewport"] = {
+        "id": "viewport",
+        "title": "Has a `<meta name=\"viewport\">` tag with `width` or `initial-scale`",
+        "description": "This audit checks if the page has a proper viewport meta tag for mobile devices. A viewport tag ensures the page displays correctly on tablets and phones.",
+        "score": 1.0 if has_viewport else 0.0,
+        "numericValue": 1.0 if has_viewport else 0.0,
+    }
+    
+    # Link names - with details
+    link_name_results = probe["linkName"]
+    link_score = max(0.0, 1 - link_name_results["failing"] / max(link_name_results["total"], 1))
+    
+    link_details_items = []
+    if link_name_results.get("items"):
+        for item in link_name_results["items"]:
+            link_details_items.append({
+                "node": item.get("node", {})
+            })
+    
+    audits["link-name"] = {
+        "id": "link-name",
+        "title": "Links have a discernible name",
+        "description": f"This audit checks if all links have descriptive text. Found {link_name_results['failing']} links without text out of {link_name_results['total']} total links.",
+        "score": link_score,
+        "numericValue": link_score,
+    }
+    
+    if link_details_items:
+        audits["link-name"]["details"] = {
+            "type": "table",
+            "headings": [
+                {"key": "node", "itemType": "node", "text": "Element"},
+                {"key": "selector", "itemType": "code", "text": "Location"}
+            ],
+            "items": link_details_items
+        }
+    
+    # Button names - with details
+    button_name_results = probe["buttonName"]
+    button_score = max(0.0, 1 - button_name_results["failing"] / max(button_name_results["total"], 1))
+    
+    button_details_items = []
+    if button_name_results.get("items"):
+        for item in button_name_results["items"]:
+            button_details_items.append({
+                "node": item.get("node", {})
+            })
+    
+    audits["button-name"] = {
+        "id": "button-name",
+        "title": "Buttons have an accessible name",
+        "description": f"This audit checks if all buttons have descriptive labels. Found {button_name_results['failing']} buttons without text out of {button_name_results['total']} total buttons.",
+        "score": button_score,
+        "numericValue": button_score,
+    }
+    
+    if button_details_items:
+        audits["button-name"]["details"] = {
+            "type": "table",
+            "headings": [
+                {"key": "node", "itemType": "node", "text": "Element"},
+                {"key": "selector", "itemType": "code", "text": "Location"}
+            ],
+            "items": button_details_items
+        }
+    
+    # Form labels - with details
+    label_results = probe["label"]
+    label_score = max(0.0, 1 - label_results["failing"] / max(label_results["total"], 1))
+    
+    label_details_items = []
+    if label_results.get("items"):
+        for item in label_results["items"]:
+            label_details_items.append({
+                "node": item.get("node", {})
+            })
+    
+    audits["label"] = {
+        "id": "label",
+        "title": "Form elements have associated labels",
+        "description": f"This audit checks if all form inputs have associated labels. Found {label_results['failing']} inputs without labels out of {label_results['total']} total inputs.",
+        "score": label_score,
+        "numericValue": label_score,
+    }
+    
+    if label_details_items:
+        audits["label"]["details"] = {
+            "type": "table",
+            "headings": [
+                {"key": "node", "itemType": "node", "text": "Element"},
+                {"key": "selector", "itemType": "code", "text": "Location"}
+            ],
+            "items": label_details_items
+        }
+    
+    # Heading order
+    heading_order_valid = probe["headingOrder"]
+    audits["heading-order"] = {
+        "id": "heading-order",
+        "title": "Heading elements appear in a sequentially-descending order",
+        "description": "This audit checks if headings follow a logical order (H1, then H2, then H3, etc.). Proper heading structure helps screen readers and improves content organization.",
+        "score": 1.0 if heading_order_valid else 0.0,
+        "numericValue": 1.0 if heading_order_valid else 0.0,
+    }
+    
+    # HTTPS check (the browser reports page.url with a lowercase scheme, no need to parse it)
+    is_https = final_url.startswith("https:")
+    audits["is-on-https"] = {
+        "id": "is-on-https",
+        "title": "Uses HTTPS",
+        "description": "This audit checks if the page is served over HTTPS. HTTPS encrypts data and provides security for users.",
+        "score": 1.0 if is_https else 0.0,
+        "numericValue": 1.0 if is_https else 0.0,
+    }
+    
+    # Text font audit - with detailed items
+    text_font_results = probe["textFont"]
+    total_text_elements = text_font_results.get("total", 0)
+    small_text_count = text_font_results.get("small", 0)
+    text_score = max(0.0, 1 - small_text_count / max(total_text_elements, 1))
+    
+    # Build details.items for table generation
+    text_details_items = []
+    if text_font_results.get("items"):
+        for item in text_font_results["items"]:
+            text_details_items.append({
+                "textSnippet": item.get("t") or "Text element",
+                "containerSelector": item.get("c", "N/A"),
+                "fontSize": item.get("f", "N/A")
+            })
+    
+    audits["text-font-audit"] = {
+        "id": "text-font-audit",
+        "title": "Text is appropriately sized for readability",
+        "description": f"This audit checks if text is large enough for readability. Found {small_text_count} text elements with font size less than 16px out of {total_text_elements} total text elements."
+                       + (f" (Estimated from the first {text_font_results['sampled']} text elements.)" if text_font_results.get("truncated") else ""),
+        "score": text_score,
+        "numericValue": text_score,
+    }
+    
+    # Add details.items if there are failing items
+    if text_details_items:
+        audits["text-font-audit"]["details"] = {
+            "type": "table",
+            "headings": [
+                {"key": "textSnippet", "itemType": "text", "text": "Text Content"},
+                {"key": "containerSelector", "itemType": "code", "text": "Element Selector"},
+                {"key": "fontSize", "itemType": "text", "text": "Reason"}
+            ],
+            "items": text_details_items
+        }
+    
+    # Performance metrics
+    performance_metrics = probe["perf"]
+    
+    # Largest Contentful Paint (LCP): 1.0 up to 2500ms, linear down to 0 at 5000ms
+    lcp = performance_metrics.get("lcp", 0)
+    lcp_score = max(0.0, min(1.0, 1 - (lcp - 2500) / 2500))
+    audits["largest-contentful-paint"] = {
+        "id": "largest-contentful-paint",
+        "title": "Largest Contentful Paint",
+        "description": f"This audit measures how long it takes for the main content to load. LCP time: {lcp:.0f}ms. Good if under 2500ms.",
+        "score": lcp_score,
+        "numericValue": lcp,
+    }
+    
+    # Cumulative Layout Shift (CLS) - measured from the layout-shift entries in the probe
+    cls_data = probe["cls"]
+    cls_score = cls_data.get("score", 1.0)
+    cls_value = cls_data.get("cls", 0)
+    
+    audits["cumulative-layout-shift"] = {
+        "id": "cumulative-layout-shift",
+        "title": "Cumulative Layout Shift",
+        "description": f"This audit measures visual stability. CLS value: {cls_value:.3f}. A low CLS score means the page layout is stable and doesn't shift unexpectedly, which is important for older adults.",
+        "score": cls_score,
+        "numericValue": cls_value,
+    }
+    
+    # Missing audits - set to 0 (not None) so they're included in weight calculation
+    # CRITICAL: Must use 0, not None, to match old backend behavior
+    # The old backend returns 0 for missing audits, which are included in total weight
+    # If we use None, pdf_generator.js filters them out, reducing total weight
+    if not is_lite:
+        # Constant placeholder audits (see _STATIC_FULL_AUDITS), copied so reports don't share them
+        audits.update({audit_id: dict(audit) for audit_id, audit in _STATIC_FULL_AUDITS.items()})
+        
+        # Total Blocking Time (TBT) - from long tasks in the probe, estimated from load time without them
+        tbt_data = probe["tbt"]
+        tbt_score = tbt_data.get("score", 1.0)
+        tbt_value = tbt_data.get("tbt", 0)
+        
+        audits["total-blocking-time"] = {
+            "id": "total-blocking-time",
+            "title": "Total Blocking Time",
+            "description": f"This audit measures the total amount of time that a page is blocked from responding to user input. TBT: {tbt_value:.0f}ms. Lower is better.",
+            "score": tbt_score,
+            "numericValue": tbt_value,
+        }
+        
+        # DOM size audit
+        dom_size = probe["domSize"]
+        dom_size_score = max(0.0, min(1.0, 1 - (dom_size - 1500) / 1500))
+        
+        # Sample DOM elements (navigation items, nested positioned divs) for the findings table
+        sample_elements = probe["sampleElements"]
+        
+        # Build details.items in the format expected by PDF generator's default table config
+        # Default config expects: item.node?.nodeLabel, item.node?.selector, item.explanation
+        details_items = []
+        if sample_elements:
+            for elem in sample_elements:
+                details_items.append({
+                    "node": {
+                        "nodeLabel": elem.get("nodeLabel", "Page Element"),
+                        "selector": elem.get("selector", "N/A")
+                    },
+                    "explanation": elem.get("explanation", "May impact older adult users")
+                })
+        
+        audits["dom-size"] = {
+            "id": "dom-size",
+            "title": "Avoids an excessive DOM size",
+            "description": f"This audit checks if the page has a reasonable number of DOM elements. Found {dom_size} elements. Recommended: under 1500.",
+            "score": dom_size_score,
+            "numericValue": dom_size,
+            "displayValue": f"{dom_size} elements",
+            "details": {
+                "type": "table",
+                "items": details_items
+            } if details_items else None
+        }
+        
+        # Geolocation on start - check if page requests geolocation immediately
+        geolocation_requested = probe["geolocationRequested"]
+        audits["geolocation-on-start"] = {
+            "id": "geolocation-on-start",
+            "title": "Does not request geolocation on page load",
+            "description": "This audit checks if the page requests user location immediately on load, which can be intrusive for older adults.",
+            "score": 1.0 if not geolocation_requested else 0.0,
+            "numericValue": 1.0 if not geolocation_requested else 0.0,
+        }
+    
+    # Build Lighthouse-compatible report
+    category = _LITE_CATEGORY_BASE if is_lite else _FULL_CATEGORY_BASE
+    
+    final_score = calculate_score({"audits": audits}, is_lite)
+    
+    report = {
+        "lighthouseVersion": "10.0.0",
+        "fetchTime": time.time_ns() // 1_000_000,
+        "requestedUrl": url,
+        "finalUrl": final_url,
+        "categories": {
+            category["id"]: {**category, "score": final_score / 100}
+        },
+        "audits": audits
+    }
+    
+    return {
+        "success": True,
+        "report": report,
+        "score": final_score
+    }
+
+
+async def _run_camoufox_audit_after(delay: float, start_now: asyncio.Event, url: str, device_config: Dict[str, Any], is_lite: bool, skip_assets: bool = False, fresh_session: bool = True) -> Dict[str, Any]:
+    """Hedged fallback: start the custom Camoufox audit after `delay` seconds, or as soon as `start_now` is set."""
+    try:
+        await asyncio.wait_for(start_now.wait(), delay)
+    except asyncio.TimeoutError:
+        pass
+    return await _run_camoufox_audit(url, device_config, is_lite, skip_assets=skip_assets, fresh_session=fresh_session)
+
+
+def _audit_cache_key(request: AuditRequest, url: str) -> Tuple[str, str, bool, bool, bool, bool]:
+    """`url` is the normalized URL the audit runs on, so equal keys always mean the same audit"""
+    return (url, request.device, request.isLiteVersion, request.skipAssets, request.freshSession, request.persistReport)
+
+
+# Audits admitted past the cache and not finished yet (see MAX_PENDING_AUDITS)
+_pending_audits = 0
+
+
+async def _cached_audit(request: AuditRequest) -> Tuple[AuditResponse, bool]:
+    """Run an audit through the audit cache; returns (response, cache_hit)"""
+    url, hostname = _normalize_url(request.url)
+    key = _audit_cache_key(request, url)
+    cached = audit_cache.get(key)
+    if cached is not None:
+        logger.info(f"⚡ Serving cached audit for {key[0]} ({key[1]})")
+        if request.persistReport and cached.report is not None:
+            # Every audit that asks for a report file gets a new one, rather than the path
+            # of the file written for the cached audit (which may still be in flight)
+            _, report_hostname = _normalize_url(cached.url)
+            report_path = _new_report_path(report_hostname, request.isLiteVersion)
+            _persist_report(cached.report, report_path)
+            cached = cached.model_copy(update={"reportPath": safe_text(report_path)})
+        return cached, True
+    
+    global _pending_audits
+    if MAX_PENDING_AUDITS and _pending_audits >= MAX_PENDING_AUDITS:
+        raise HTTPException(
+            status_code=503,
+            detail="Scanner is busy, please retry shortly",
+            headers={"Retry-After": "30"},
+        )
+    _pending_audits += 1
+    try:
+        result = await _perform_audit(request, url, hostname)
+    finally:
+        _pending_audits -= 1
+    if result.success:
+        audit_cache.set(key, result)
+    return result, False
 
 
 @app.post("/audit", response_model=AuditResponse)
-async def perform_audit(request: AuditRequest):
+async def perform_audit(request: AuditRequest, response: Response):
+    """
+    Perform accessibility audit, serving identical recent requests from the audit cache
+    """
+    result, hit = await _cached_audit(request)
+    response.headers["X-Cache"] = "HIT" if hit else "MISS"
+    return result
+
+
+@app.post("/audit/batch", response_model=List[AuditResponse])
+async def perform_batch_audit(request: BatchAuditRequest):
+    """
+    Audit several URLs in one call. They run concurrently (at most
+    BATCH_AUDIT_CONCURRENCY at a time) and results come back in request order.
+    """
+    semaphore = asyncio.Semaphore(BATCH_AUDIT_CONCURRENCY)
+    
+    async def audit_one(url: str) -> AuditResponse:
+        async with semaphore:
+            try:
+                result, _ = await _cached_audit(AuditRequest(
+                    url=url,
+                    device=request.device,
+                    format=request.format,
+                    isLiteVersion=request.isLiteVersion,
+                    skipAssets=request.skipAssets,
+                    freshSession=request.freshSession,
+                    persistReport=request.persistReport,
+                ))
+            except HTTPException as e:
+                if e.status_code != 503:
+                    raise
+                # Over MAX_PENDING_AUDITS: only this URL is turned away, not the whole batch
+                return AuditResponse(
+                    success=False,
+                    error=e.detail,
+                    errorCode="BUSY",
+                    isLiteVersion=request.isLiteVersion,
+                    version="Lite" if request.isLiteVersion else "Full",
+                    url=safe_text(url),
+                    device=safe_text(request.device),
+                    strategy="Python-Camoufox",
+                    message=safe_text(f"Audit not started: {e.detail}"),
+                )
+            return result
+    
+    # _perform_audit turns failures into AuditResponse(success=False) and audit_one does
+    # the same for URLs turned away as busy, so one bad URL doesn't fail the batch
+    return await asyncio.gather(*(audit_one(url) for url in request.urls))
+
+
+async def _perform_audit(request: AuditRequest, url: str, hostname: str) -> AuditResponse:
     """
     Perform accessibility audit using Lighthouse + Camoufox (with fallback to custom audits)
+
+    The custom Camoufox audit is hedged: it starts AUDIT_HEDGE_DELAY seconds into
+    the Lighthouse attempt and runs alongside it. Lighthouse still wins whenever it
+    succeeds (the hedge is cancelled); when it fails the fallback is already underway,
+    or starts right away if the hedge delay hasn't run out yet.
+
+    `url` and `hostname` come from _normalize_url(request.url), already computed for the cache key.
     """
+    camoufox_task: Optional[asyncio.Task] = None
+    start_hedge_now = asyncio.Event()
     try:
-        # Normalize URL
-        url = request.url
-        if not url.startswith(("http://", "https://")):
-            url = f"https://{url}"
-        
         version = "Lite" if request.isLiteVersion else "Full"
-        print(f"\n=== Starting {version} audit for {url} ===")
-        print(f"Device: {request.device}")
+        logger.info(f"\n=== Starting {version} audit for {url} ===")
+        logger.info(f"Device: {request.device}")
         
         # HYBRID APPROACH: Use Camoufox to navigate (anti-bot), then Lighthouse to audit
         if LIGHTHOUSE_AVAILABLE:
+            if AUDIT_HEDGE_DELAY >= 0:
+                camoufox_task = asyncio.create_task(_run_camoufox_audit_after(
+                    AUDIT_HEDGE_DELAY, start_hedge_now, url, get_viewport_for_device(request.device), request.isLiteVersion,
+                    skip_assets=request.skipAssets, fresh_session=request.freshSession
+                ))
             try:
-                print("🔍 Attempting hybrid Camoufox + Lighthouse audit...")
-                print("   Step 1: Camoufox navigates to site (anti-bot bypass)...")
+                logger.info("🔍 Attempting hybrid Camoufox + Lighthouse audit...")
+                logger.info("   Step 1: Camoufox navigates to site (anti-bot bypass)...")
                 
                 # Get device configuration
                 device_config = get_viewport_for_device(request.device)
                 
                 # Step 1: Use Camoufox to navigate and get past bot protection
-                # We'll launch Camoufox, navigate, then get the CDP endpoint for Lighthouse
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor() as executor:
-                    # Launch Camoufox and navigate
-                    cdp_result = await loop.run_in_executor(
-                        executor,
-                        _launch_camoufox_and_get_cdp,
-                        url,
-                        device_config
-                    )
+                # Camoufox navigates, then we hand the final URL to Lighthouse
+                cdp_result = await _launch_camoufox_and_get_cdp(url, device_config)
                 
                 if cdp_result.get("success"):
                     final_url = cdp_result.get("url", url)
                     cdp_endpoint = cdp_result.get("cdp_endpoint")
                     
-                    print(f"   ✅ Camoufox navigation successful")
+                    logger.info("   ✅ Camoufox navigation successful")
                     
                     if cdp_endpoint:
-                        print(f"   Step 2: Lighthouse connecting to browser via CDP...")
-                        print(f"   CDP Endpoint: {cdp_endpoint[:60]}...")
+                        logger.info("   Step 2: Lighthouse connecting to browser via CDP...")
+                        logger.info(f"   CDP Endpoint: {cdp_endpoint[:60]}...")
                     else:
-                        print(f"   Step 2: Lighthouse auditing URL that Camoufox successfully loaded...")
+                        logger.info("   Step 2: Lighthouse auditing URL that Camoufox successfully loaded...")
                     
                     # Step 2: Use Lighthouse (with CDP if available, otherwise just URL)
                     try:
@@ -1523,8 +1826,8 @@ async def perform_audit(request: AuditRequest):
                         # If Lighthouse fails to load the page (403, 404, etc.), fall back to Camoufox
                         error_str = str(lh_error).lower()
                         if "403" in error_str or "404" in error_str or "unable to reliably load" in error_str or "errored_document_request" in error_str:
-                            print(f"   ⚠️ Lighthouse failed to load page (likely blocked): {lh_error}")
-                            print("   🔄 Falling back to custom Camoufox audits...")
+                            logger.warning(f"   ⚠️ Lighthouse failed to load page (likely blocked): {lh_error}")
+                            logger.info("   🔄 Falling back to custom Camoufox audits...")
                             raise Exception("Lighthouse page load failed")  # This will trigger fallback
                         else:
                             # Re-raise other errors
@@ -1544,9 +1847,9 @@ async def perform_audit(request: AuditRequest):
                         ]
                         
                         if errored_audits:
-                            print(f"   ⚠️ Lighthouse detected page load errors in {len(errored_audits)} audits")
-                            print(f"   Failed audits: {', '.join(errored_audits[:5])}")
-                            print("   🔄 Falling back to custom Camoufox audits...")
+                            logger.warning(f"   ⚠️ Lighthouse detected page load errors in {len(errored_audits)} audits")
+                            logger.info(f"   Failed audits: {', '.join(errored_audits[:5])}")
+                            logger.info("   🔄 Falling back to custom Camoufox audits...")
                             raise Exception("Lighthouse page load errors detected")
                     
                     # Calculate score from Lighthouse report
@@ -1554,29 +1857,27 @@ async def perform_audit(request: AuditRequest):
                     
                     if final_score > 0:
                         # Save report to file
-                        url_obj = urlparse(final_url)
-                        hostname = url_obj.hostname.replace(".", "-") if url_obj.hostname else "unknown"
-                        timestamp = int(time.time() * 1000)
-                        version_suffix = "-lite" if request.isLiteVersion else ""
-                        report_filename = f"report-{hostname}-{timestamp}{version_suffix}.json"
+                        _, final_hostname = _normalize_url(final_url)
+                        report_path = _new_report_path(final_hostname, request.isLiteVersion) if request.persistReport else None
                         
-                        temp_dir = os.getenv("TEMP_DIR", "/tmp")
-                        os.makedirs(temp_dir, exist_ok=True)
-                        report_path = os.path.join(temp_dir, report_filename)
+                        if report_path:
+                            _persist_report(lighthouse_report, report_path)
                         
-                        with open(report_path, "w", encoding="utf-8") as f:
-                            json.dump(lighthouse_report, f, indent=2)
+                        logger.info(f"✅ Hybrid {version} audit completed successfully")
+                        logger.info(f"📊 Score: {final_score}%")
+                        if report_path:
+                            logger.info(f"📄 Saving report to: {report_path}")
                         
-                        print(f"✅ Hybrid {version} audit completed successfully")
-                        print(f"📊 Score: {final_score}%")
-                        print(f"📄 Report saved to: {report_path}")
+                        # Lighthouse won, the hedged custom audit is no longer needed
+                        if camoufox_task is not None:
+                            camoufox_task.cancel()
                         
                         # Sanitize report data to prevent UnicodeEncodeError during JSON serialization
                         sanitized_report = sanitize_report_data(lighthouse_report)
                         
                         return AuditResponse(
                             success=True,
-                            reportPath=safe_text(report_path),
+                            reportPath=safe_text(report_path) if report_path else None,
                             report=sanitized_report,
                             isLiteVersion=request.isLiteVersion,
                             version=safe_text(version),
@@ -1595,30 +1896,30 @@ async def perform_audit(request: AuditRequest):
                 error_str = str(lighthouse_error).lower()
                 # Check if it's a page load error (403, 404, etc.)
                 if "403" in error_str or "404" in error_str or "unable to reliably load" in error_str or "errored_document_request" in error_str or "page load" in error_str:
-                    print(f"⚠️ Hybrid audit failed - Page blocked or not found: {lighthouse_error}")
+                    logger.warning(f"⚠️ Hybrid audit failed - Page blocked or not found: {lighthouse_error}")
                 else:
-                    print(f"⚠️ Hybrid audit failed: {lighthouse_error}")
-                print("🔄 Falling back to custom Camoufox audits...")
+                    logger.warning(f"⚠️ Hybrid audit failed: {lighthouse_error}")
+                logger.info("🔄 Falling back to custom Camoufox audits...")
         
         # Fallback to custom Camoufox audits
-        print("🔍 Using custom Camoufox audits...")
+        logger.info("🔍 Using custom Camoufox audits...")
         
         # Get device configuration (viewport + emulation settings)
         device_config = get_viewport_for_device(request.device)
-        print(f"Viewport: {device_config.get('viewport')}")
-        print(f"User Agent: {device_config.get('user_agent', '')[:50]}...")
-        print(f"Mobile: {device_config.get('is_mobile')}, Touch: {device_config.get('has_touch')}")
+        logger.info(f"Viewport: {device_config.get('viewport')}")
+        logger.info(f"User Agent: {device_config.get('user_agent', '')[:50]}...")
+        logger.info(f"Mobile: {device_config.get('is_mobile')}, Touch: {device_config.get('has_touch')}")
         
-        # Run Camoufox in a thread pool executor to avoid blocking async event loop
-        # Camoufox uses Playwright's sync API, so we need to run it in a separate thread
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor,
-                _run_camoufox_audit_sync,
-                url,
-                device_config,
-                request.isLiteVersion
+        # Camoufox runs on the shared browser via the async API, so the event loop stays free.
+        # If the hedge was started during the Lighthouse attempt, pick up its result
+        # (waking it first, so an early Lighthouse failure doesn't sit out the delay).
+        if camoufox_task is not None:
+            start_hedge_now.set()
+            result = await camoufox_task
+        else:
+            result = await _run_camoufox_audit(
+                url, device_config, request.isLiteVersion,
+                skip_assets=request.skipAssets, fresh_session=request.freshSession
             )
         
         if not result["success"]:
@@ -1627,34 +1928,28 @@ async def perform_audit(request: AuditRequest):
         report = result["report"]
         final_score = result["score"]
         
+        # Navigation failures already surface as errors above; a loaded page that
+        # fails every weighted check is a real result, not a reason to re-run it
         if final_score == 0:
-            raise Exception("Audit score is 0, indicating a failed audit")
+            logger.warning(f"⚠️ {version} audit loaded {url} but every weighted check scored 0")
         
-        # Save report to file
-        url_obj = urlparse(url)
-        hostname = url_obj.hostname.replace(".", "-") if url_obj.hostname else "unknown"
-        timestamp = int(time.time() * 1000)
-        version_suffix = "-lite" if request.isLiteVersion else ""
-        report_filename = f"report-{hostname}-{timestamp}{version_suffix}.json"
+        # Save report to file (in REPORT_DIR)
+        report_path = _new_report_path(hostname, request.isLiteVersion) if request.persistReport else None
         
-        # Save to temp directory
-        temp_dir = os.getenv("TEMP_DIR", "/tmp")
-        os.makedirs(temp_dir, exist_ok=True)
-        report_path = os.path.join(temp_dir, report_filename)
+        if report_path:
+            _persist_report(report, report_path)
         
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
-        
-        print(f"✅ {version} audit completed successfully")
-        print(f"📊 Score: {final_score}%")
-        print(f"📄 Report saved to: {report_path}")
+        logger.info(f"✅ {version} audit completed successfully")
+        logger.info(f"📊 Score: {final_score}%")
+        if report_path:
+            logger.info(f"📄 Saving report to: {report_path}")
         
         # Sanitize report data to prevent UnicodeEncodeError during JSON serialization
         sanitized_report = sanitize_report_data(report)
         
         return AuditResponse(
             success=True,
-            reportPath=safe_text(report_path),
+            reportPath=safe_text(report_path) if report_path else None,
             report=sanitized_report,
             isLiteVersion=request.isLiteVersion,
             version=safe_text(version),
@@ -1671,7 +1966,7 @@ async def perform_audit(request: AuditRequest):
         # exceptions can contain invalid surrogate code points.
         raw_error_msg = str(e)
         error_msg = safe_text(raw_error_msg)
-        print(f"❌ Audit failed: {error_msg}")
+        logger.error(f"❌ Audit failed: {error_msg}")
         return AuditResponse(
             success=False,
             error=error_msg,
@@ -1684,81 +1979,145 @@ async def perform_audit(request: AuditRequest):
             attemptNumber=1,
             message=safe_text(f"Audit failed: {error_msg}"),
         )
+    finally:
+        # Never leave a hedged audit running once the response is decided (or the client went away)
+        if camoufox_task is not None:
+            if not camoufox_task.done():
+                camoufox_task.cancel()
+            elif not camoufox_task.cancelled():
+                camoufox_task.exception()  # mark a discarded failure as retrieved
+
+
+# Bot-protection interstitials that need a real browser to get through
+_CHALLENGE_MARKERS = (b"cf-chl", b"challenge-platform", b"just a moment...", b"captcha")
+
+
+async def _precheck_url_http(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Precheck with a plain HTTP request. Returns None when the answer needs the
+    browser (error status, challenge page, too little content or network error).
+    """
+    try:
+        response = await http_client.get(url)
+    except Exception:
+        return None
+    
+    # Only a 2xx settles it here; blocks (403/429/503), 404s and 5xx go to the browser
+    if not response.is_success:
+        return None
+    body = response.content
+    if len(body) <= 1000:
+        return None
+    head = body[:65536].lower()
+    if any(marker in head for marker in _CHALLENGE_MARKERS):
+        return None
+    
+    final_url = str(response.url)
+    return {
+        "success": True,
+        "finalUrl": final_url,
+        "status": response.status_code,
+        "redirected": final_url != url
+    }
 
 
-def _precheck_url_sync(url: str) -> Dict[str, Any]:
+async def _precheck_url(url: str, skip_assets: bool = True, fresh_session: bool = False) -> Dict[str, Any]:
     """
     Lightweight precheck: Just verify URL is reachable using Camoufox.
     This is much faster than a full audit - just navigates and checks status.
-    Thread-safe using a lock to prevent concurrent browser access issues.
+    Runs on an isolated context of the shared browser, so prechecks can run concurrently.
+    Sites that answer a plain HTTP request are confirmed without the browser.
     """
-    # Use lock to ensure thread-safe access (one precheck at a time)
-    with _precheck_lock:
-        try:
-            # Use Camoufox with context manager (proper usage pattern)
-            with Camoufox(headless=True) as browser:
-                page = browser.new_page()
+    if http_client is not None:
+        result = await _precheck_url_http(url)
+        if result is not None:
+            return result
+    
+    try:
+        # Borrow a context from the shared Camoufox browser; unless a fresh session is
+        # asked for, it is the host's warm desktop context (shared with the audit's navigation)
+        reuse_key = None if fresh_session else (urlparse(url).netloc, DEVICE_CONFIGS["desktop"]["user_agent"])
+        # Desktop viewport and realistic user agent, set on the context
+        async with browser_pool.context(skip_assets=skip_assets, reuse_key=reuse_key,
+                                        context_options=DEVICE_CONFIGS["desktop"]["context_options"]) as context:
+            page = await context.new_page()
+            
+            try:
+                # Navigate with a shorter timeout for precheck (30 seconds). Reachability is
+                # known at DOMContentLoaded; the load event only gets a short grace period
+                # so pages with never-ending subresources don't hit the timeout.
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                await _wait_for_settle(page, 5000, "load")
                 
-                # Set basic viewport
-                page.set_viewport_size({"width": 1920, "height": 1080})
+                # Get final URL after redirects
+                final_url = page.url
+                status_code = response.status if response else None
                 
-                # Set realistic user agent
-                context = page.context
-                context.set_extra_http_headers({
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                })
+                # Check if redirected
+                redirected = final_url != url
                 
-                try:
-                    # Navigate with a shorter timeout for precheck (30 seconds)
-                    response = page.goto(url, wait_until="load", timeout=30000)
-                    
-                    # Get final URL after redirects
-                    final_url = page.url
-                    status_code = response.status if response else None
-                    
-                    # Check if redirected
-                    redirected = final_url != url
-                    
-                    # Quick check: verify page has some content (not blocked)
-                    content = page.content()
-                    has_content = len(content) > 1000  # At least 1KB of content
-                    
-                    if not has_content:
-                        return {
-                            "success": False,
-                            "error": "Page loaded but has insufficient content (may be blocked)"
-                        }
-                    
+                # Quick check: verify page has some content (not blocked).
+                # Only the length is needed, so measure it in the page instead of
+                # shipping the whole serialized document over to Python.
+                content_length = await page.evaluate("() => document.documentElement ? document.documentElement.outerHTML.length : 0")
+                has_content = content_length > 1000  # At least 1KB of content
+                
+                if not has_content:
                     return {
-                        "success": True,
-                        "finalUrl": final_url,
-                        "status": status_code,
-                        "redirected": redirected
+                        "success": False,
+                        "error": "Page loaded but has insufficient content (may be blocked)"
                     }
-                except Exception as nav_error:
-                    error_msg = str(nav_error)
-                    # Check if it's a timeout or connection error
-                    if "timeout" in error_msg.lower() or "timeout" in str(type(nav_error)).lower():
-                        return {
-                            "success": False,
-                            "error": f"Request timeout: {error_msg}"
-                        }
-                    elif "403" in error_msg or "forbidden" in error_msg.lower():
-                        # 403 might still mean the site is accessible, just blocked automated requests
-                        # But for precheck, we'll consider it a failure
-                        return {
-                            "success": False,
-                            "error": f"Access forbidden (403): Site may block automated requests"
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Navigation failed: {error_msg}"
-                        }
-                    
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Precheck failed: {str(e)}"
-            }
+                
+                return {
+                    "success": True,
+                    "finalUrl": final_url,
+                    "status": status_code,
+                    "redirected": redirected
+                }
+            except Exception as nav_error:
+                error_msg = str(nav_error)
+                # Check if it's a timeout or connection error
+                if "timeout" in error_msg.lower() or "timeout" in str(type(nav_error)).lower():
+                    return {
+                        "success": False,
+                        "error": f"Request timeout: {error_msg}"
+                    }
+                elif "403" in error_msg or "forbidden" in error_msg.lower():
+                    # 403 might still mean the site is accessible, just blocked automated requests
+                    # But for precheck, we'll consider it a failure
+                    return {
+                        "success": False,
+                        "error": f"Access forbidden (403): Site may block automated requests"
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": f"Navigation failed: {error_msg}"
+                    }
+                
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Precheck failed: {str(e)}"
+        }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # The scanner is pure I/O (browser IPC, Node subprocesses, HTTP): use the
+    # C event loop and HTTP parser when they are installed (uvicorn[standard])
+    loop = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
 
+    uvicorn.run(
+        "scanner_service:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8001")),
+        # Each worker runs its own browser, Lighthouse daemons and audit cache
+        workers=int(os.getenv("WORKERS", "1")),
+        loop=loop,
+        http=http,
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "10")),
+        timeout_keep_alive=int(os.getenv("TIMEOUT_KEEP_ALIVE", "300")),
+    )
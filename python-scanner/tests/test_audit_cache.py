@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("camoufox")
+
+import scanner_service  # noqa: E402
+from scanner_service import AuditRequest, AuditResponse  # noqa: E402
+
+
+@pytest.fixture
+def audited_urls(monkeypatch):
+    urls = []
+    
+    async def fake_audit(request, url, hostname):
+        urls.append(url)
+        return AuditResponse(success=True, url=url)
+    
+    monkeypatch.setattr(scanner_service, "audit_cache", scanner_service.AuditResultCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(scanner_service, "_perform_audit", fake_audit)
+    return urls
+
+
+def test_cache_key_uses_the_url_that_is_audited(audited_urls):
+    request = AuditRequest(url="  example.com/docs/ ")
+    response, hit = asyncio.run(scanner_service._cached_audit(request))
+    
+    assert not hit
+    assert audited_urls == ["https://example.com/docs/"]
+    key = scanner_service._audit_cache_key(request, "https://example.com/docs/")
+    assert scanner_service.audit_cache.get(key) is response
+
+
+def test_urls_audited_differently_do_not_share_a_cache_entry(audited_urls):
+    asyncio.run(scanner_service._cached_audit(AuditRequest(url="example.com/docs/")))
+    _, hit = asyncio.run(scanner_service._cached_audit(AuditRequest(url="example.com/docs")))
+    
+    assert not hit
+    assert audited_urls == ["https://example.com/docs/", "https://example.com/docs"]
+
+
+def test_same_url_hits_the_cache_after_normalization(audited_urls):
+    asyncio.run(scanner_service._cached_audit(AuditRequest(url="example.com")))
+    _, hit = asyncio.run(scanner_service._cached_audit(AuditRequest(url=" https://example.com ")))
+    
+    assert hit
+    assert audited_urls == ["https://example.com"]
+
+
+def test_cache_hit_persists_its_own_report(monkeypatch, tmp_path):
+    monkeypatch.setattr(scanner_service, "REPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(scanner_service, "audit_cache", scanner_service.AuditResultCache(maxsize=8, ttl=60))
+    
+    async def fake_audit(request, url, hostname):
+        report_path = str(tmp_path / "report-first.json")
+        scanner_service._write_report({"audits": {}}, report_path)
+        return AuditResponse(success=True, url=url, report={"audits": {}}, reportPath=report_path)
+    
+    monkeypatch.setattr(scanner_service, "_perform_audit", fake_audit)
+    
+    async def audit_twice():
+        first, _ = await scanner_service._cached_audit(AuditRequest(url="example.com"))
+        second, hit = await scanner_service._cached_audit(AuditRequest(url="example.com"))
+        await asyncio.gather(*scanner_service._pending_report_writes)
+        return first, second, hit
+    
+    first, second, hit = asyncio.run(audit_twice())
+    
+    assert hit
+    assert second.reportPath != first.reportPath
+    assert second.reportPath.startswith(str(tmp_path / "report-example-com-"))
+    assert (tmp_path / second.reportPath).read_bytes() == (tmp_path / first.reportPath).read_bytes()
+    assert second.report is first.report
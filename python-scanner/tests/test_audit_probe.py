@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+camoufox_async = pytest.importorskip("camoufox.async_api")
+
+from scanner_service import COMBINED_AUDIT_JS  # noqa: E402
+
+# Identical siblings whose font size only differs through a structural selector
+NTH_CHILD_PAGE = """
+<html><head><style>
+li { font-size: 18px; }
+li:nth-child(odd) { font-size: 10px; }
+</style></head><body>
+<ul>""" + "".join(f'<li class="item">Item {i}</li>' for i in range(10)) + """</ul>
+</body></html>
+"""
+
+
+async def _probe(html: str):
+    try:
+        camoufox = camoufox_async.AsyncCamoufox(headless=True)
+        browser = await camoufox.__aenter__()
+    except Exception as e:  # browser binary not fetched (camoufox fetch)
+        pytest.skip(f"Camoufox browser unavailable: {e}")
+    try:
+        page = await browser.new_page()
+        await page.set_content(html)
+        return await page.evaluate(COMBINED_AUDIT_JS, False)
+    finally:
+        await camoufox.__aexit__(None, None, None)
+
+
+def test_text_font_sizes_follow_structural_selectors():
+    text_font = asyncio.run(_probe(NTH_CHILD_PAGE))["textFont"]
+    
+    small_items = [item for item in text_font["items"] if item["c"] == "li.item"]
+    assert [item["t"] for item in small_items] == [f"Item {i}" for i in range(0, 10, 2)]
+    assert all(item["f"] == "10.0px" for item in small_items)
+    assert text_font["small"] == 5
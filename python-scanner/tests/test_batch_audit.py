@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("camoufox")
+
+import scanner_service  # noqa: E402
+from scanner_service import AuditResponse, BatchAuditRequest, perform_batch_audit  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(scanner_service, "audit_cache", scanner_service.AuditResultCache(maxsize=0, ttl=0))
+
+
+async def _fake_audit(request, url, hostname):
+    await asyncio.sleep(0)
+    return AuditResponse(success=True, url=request.url)
+
+
+def test_batch_returns_busy_per_url_when_pending_limit_is_full(monkeypatch):
+    monkeypatch.setattr(scanner_service, "MAX_PENDING_AUDITS", 2)
+    monkeypatch.setattr(scanner_service, "_pending_audits", 2)
+    monkeypatch.setattr(scanner_service, "_perform_audit", _fake_audit)
+    
+    results = asyncio.run(perform_batch_audit(BatchAuditRequest(urls=["a.example", "b.example"])))
+    
+    assert [r.url for r in results] == ["a.example", "b.example"]
+    assert all(not r.success and r.errorCode == "BUSY" for r in results)
+
+
+def test_batch_keeps_admitted_results_when_later_urls_are_busy(monkeypatch):
+    monkeypatch.setattr(scanner_service, "MAX_PENDING_AUDITS", 1)
+    monkeypatch.setattr(scanner_service, "_pending_audits", 0)
+    monkeypatch.setattr(scanner_service, "_perform_audit", _fake_audit)
+    
+    results = asyncio.run(perform_batch_audit(BatchAuditRequest(urls=["a.example", "b.example"])))
+    
+    assert results[0].success
+    assert not results[1].success and results[1].errorCode == "BUSY"
+    assert scanner_service._pending_audits == 0
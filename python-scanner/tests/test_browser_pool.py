@@ -0,0 +1,143 @@
+import asyncio
+import types
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("camoufox")
+
+import scanner_service  # noqa: E402
+from scanner_service import CamoufoxBrowserPool  # noqa: E402
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+class FakeCamoufox:
+    """Stands in for AsyncCamoufox: every launch is a new FakeBrowser"""
+    launched = []
+
+    def __init__(self, **kwargs):
+        self.browser = FakeBrowser()
+
+    async def __aenter__(self):
+        FakeCamoufox.launched.append(self.browser)
+        return self.browser
+
+    async def __aexit__(self, *exc):
+        self.browser.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_camoufox(monkeypatch):
+    FakeCamoufox.launched = []
+    monkeypatch.setattr(scanner_service, "AsyncCamoufox", FakeCamoufox)
+
+
+def test_active_contexts_are_counted_while_borrowed():
+    pool = CamoufoxBrowserPool(max_contexts=4)
+    
+    async def scan():
+        async with pool.context() as first:
+            browser = pool._browser
+            async with pool.context():
+                assert pool._active[browser] == 2
+            assert pool._active[browser] == 1
+        assert pool._active[browser] == 0
+        assert first.closed
+    
+    asyncio.run(scan())
+    assert len(FakeCamoufox.launched) == 1
+
+
+def test_browser_is_retired_after_max_uses():
+    pool = CamoufoxBrowserPool(max_contexts=4, max_uses=2)
+    
+    async def scans():
+        async with pool.context():
+            pass
+        old = pool._browser
+        async with pool.context():
+            # Retired on its second use, but kept open until this scan is done
+            assert pool._browser is None
+            assert not old.closed
+        assert old.closed
+        assert old not in pool._active
+        async with pool.context():
+            assert pool._browser is not old
+    
+    asyncio.run(scans())
+    assert len(FakeCamoufox.launched) == 2
+
+
+def test_disconnected_browser_is_relaunched():
+    pool = CamoufoxBrowserPool(max_contexts=4)
+    
+    async def scans():
+        async with pool.context():
+            pass
+        dead = pool._browser
+        dead.connected = False
+        async with pool.context():
+            assert pool._browser is not dead
+        return dead
+    
+    dead = asyncio.run(scans())
+    assert dead.closed
+    assert len(FakeCamoufox.launched) == 2
+
+
+def test_warm_context_is_reused_then_evicted_when_idle(monkeypatch):
+    pool = CamoufoxBrowserPool(max_contexts=4, idle_ttl=60)
+    clock = [1000.0]
+    # Only the pool's clock is moved, not the event loop's
+    monkeypatch.setattr(scanner_service, "time", types.SimpleNamespace(monotonic=lambda: clock[0]))
+    
+    async def scans():
+        async with pool.context(reuse_key=("example.com", "ua")) as first:
+            pass
+        assert not first.closed
+        async with pool.context(reuse_key=("example.com", "ua")) as second:
+            assert second is first
+        clock[0] += 61
+        async with pool.context():
+            pass
+        return first
+    
+    first = asyncio.run(scans())
+    assert first.closed
+    assert pool._idle == {}
@@ -0,0 +1,57 @@
+import asyncio
+import sys
+
+import pytest
+
+lighthouse_integration = pytest.importorskip("lighthouse_integration")
+
+# Speaks the lighthouse_daemon.js protocol (one JSON request / reply per line):
+# "stale" first answers a request that was abandoned earlier, "hang" never answers
+STUB_DAEMON = r"""
+import json, sys, time
+for line in sys.stdin:
+    request = json.loads(line)
+    if request["mode"] == "hang":
+        time.sleep(3600)
+    if request["mode"] == "stale":
+        print("some dependency log line", flush=True)
+        print(json.dumps({"id": request["id"] - 1, "success": True, "stale": True}), flush=True)
+    print(json.dumps({"id": request["id"], "success": True, "mode": request["mode"]}), flush=True)
+"""
+
+
+@pytest.fixture
+def stub_daemon(monkeypatch, tmp_path):
+    script = tmp_path / "stub_daemon.py"
+    script.write_text(STUB_DAEMON)
+    real_exec = asyncio.create_subprocess_exec
+    
+    async def exec_stub(program, daemon_script, **kwargs):
+        return await real_exec(sys.executable, str(script), **kwargs)
+    
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", exec_stub)
+
+
+def test_worker_skips_stale_replies_and_recovers_from_a_timeout(stub_daemon):
+    worker = lighthouse_integration._LighthouseWorker()
+    
+    async def requests():
+        reply = await worker.run({"mode": "stale"}, timeout=10)
+        assert reply == {"id": 1, "success": True, "mode": "stale"}
+        first_process = worker._process
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await worker.run({"mode": "hang"}, timeout=0.5)
+        # The hung daemon is killed so it can't block later requests
+        assert worker._process is None
+        await first_process.wait()
+        assert first_process.returncode is not None
+        
+        reply = await worker.run({"mode": "ok"}, timeout=10)
+        assert reply == {"id": 3, "success": True, "mode": "ok"}
+        last_process = worker._process
+        assert last_process is not first_process
+        worker.kill()
+        await last_process.wait()
+    
+    asyncio.run(requests())
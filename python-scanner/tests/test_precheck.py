@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("camoufox")
+httpx = pytest.importorskip("httpx")
+
+import scanner_service  # noqa: E402
+
+PAGE = b"<html><body>" + b"content " * 200 + b"</body></html>"
+
+
+def _precheck_with_status(monkeypatch, status: int):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(status, content=PAGE)))
+    monkeypatch.setattr(scanner_service, "http_client", client)
+    return asyncio.run(scanner_service._precheck_url_http("https://example.com/"))
+
+
+def test_http_precheck_accepts_a_success_status(monkeypatch):
+    result = _precheck_with_status(monkeypatch, 200)
+    
+    assert result == {"success": True, "finalUrl": "https://example.com/", "status": 200, "redirected": False}
+
+
+@pytest.mark.parametrize("status", [403, 404, 429, 500, 503])
+def test_http_precheck_leaves_error_statuses_to_the_browser(monkeypatch, status):
+    assert _precheck_with_status(monkeypatch, status) is None
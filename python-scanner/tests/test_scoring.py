@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("camoufox")
+
+import scanner_service  # noqa: E402
+from scanner_service import calculate_score  # noqa: E402
+
+# Mixed scores plus the edge cases of the old `result ? (result.score ?? 0) : 0`:
+# a null score, an empty result, and audits missing from the report entirely
+REPORT = {"audits": {
+    "color-contrast": {"score": 0.87},
+    "target-size": {"score": 0.5},
+    "text-font-audit": {"score": 0.3333},
+    "viewport": {"score": 1.0},
+    "link-name": {"score": None},
+    "button-name": {},
+    "label": {"score": 0.0},
+    "heading-order": {"score": 1},
+    "is-on-https": {"score": 1.0},
+    "largest-contentful-paint": {"score": 0.91},
+    "cumulative-layout-shift": {"score": 0.77},
+    "total-blocking-time": {"score": 0.64},
+    "dom-size": {"score": 0.45},
+    "interactive-color-audit": {"score": 0.0},
+    "geolocation-on-start": {"score": 1.0},
+}}
+
+
+def test_scores_match_the_baseline_implementation():
+    # Numbers produced by the original loop-based calculate_score for REPORT
+    assert calculate_score(REPORT, is_lite=True) == 52.11
+    assert calculate_score(REPORT, is_lite=False) == 45.58
+
+
+def test_missing_audits_still_count_towards_the_total_weight():
+    assert calculate_score({"audits": {}}, is_lite=True) == 0.0
+    assert calculate_score({}, is_lite=False) == 0.0
+    assert calculate_score({"audits": {"color-contrast": {"score": 1.0}}}, is_lite=True) == round(5 / 33 * 100, 2)
+
+
+def test_weight_tables_follow_the_audit_refs():
+    assert scanner_service._LITE_IDS_WEIGHTS == tuple((ref.id, ref.weight) for ref in scanner_service.LITE_AUDIT_REFS)
+    assert scanner_service._FULL_IDS_WEIGHTS == tuple((ref.id, ref.weight) for ref in scanner_service.FULL_AUDIT_REFS)
+    assert scanner_service._LITE_TOTAL_WEIGHT == 33
+    assert scanner_service._FULL_TOTAL_WEIGHT == 112